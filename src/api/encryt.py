@@ -1,11 +1,67 @@
-from hashlib import md5
+from __future__ import annotations
+
+from hashlib import blake2b, md5
+from typing import TYPE_CHECKING
 
 from src.core.controller import Controller
+from src.utils.logging import system_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from src.core.config import SystemConfig
+    from src.schemas.event import UpdateEventData
+
+
+# md5 仅在 OpenSSL 可用时为 C/汇编实现，否则退化为 Python 内置的较慢实现
+MD5_OPENSSL_BACKED = md5.__name__ == "openssl_md5"
+
+
+def _plain(password: str) -> str:
+    return password
+
+
+def build_encryptor(method: str, salt: str) -> Callable[[str], str]:
+    """
+    根据加密方式与盐生成加密函数，盐在此处预先编码，避免每次加密重复处理
+    """
+    if method == "plain":
+        return _plain
+    elif method == "md5":
+        # 保留以兼容旧配置，新配置推荐使用 blake2b
+        if not MD5_OPENSSL_BACKED:
+            system_logger.warning("当前 Python 的 md5 未使用 OpenSSL 实现，推荐将加密方式切换为 blake2b")
+
+        suffix = b"." + salt.encode()
+
+        def _md5(password: str) -> str:
+            return md5(password.encode() + suffix).hexdigest()
+
+        return _md5
+    elif method == "blake2b":
+        key = salt.encode()
+        if len(key) > 64:
+            # blake2b 的 key 最长为 64 字节
+            key = blake2b(key).digest()
+
+        def _blake2b(password: str) -> str:
+            # 16 字节摘要为 32 位十六进制，与 md5 等长，满足用户密码字段的长度限制
+            return blake2b(password.encode(), key=key, digest_size=16).hexdigest()
+
+        return _blake2b
+    raise ValueError(f"unknown encryption type {method}")
+
+
+_encryptor: Callable[[str], str] | None = None
+
+
+def update_encryptor(_: UpdateEventData[SystemConfig] | None = None):
+    global _encryptor
+    server = Controller.config.server
+    _encryptor = build_encryptor(server.encryption_method, server.encryption_salt)
 
 
 def encrypt(password: str):
-    if Controller.config.server.encryption_method == "plain":
-        return password
-    elif Controller.config.server.encryption_method == "md5":
-        return md5(f"{password}.{Controller.config.server.encryption_salt}".encode()).hexdigest()
-    raise ValueError(f"unknown encryption type {Controller.config.server.encryption_method}")
+    if _encryptor is None:
+        update_encryptor()
+    return _encryptor(password)  # type: ignore
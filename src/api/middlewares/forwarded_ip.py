@@ -1,39 +1,68 @@
 import ipaddress
-from collections.abc import Awaitable, Callable
+from ipaddress import IPv4Network, IPv6Network
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from src.core.constants import TRUSTED_PROXIES
 
 
+def _compile_trusted_proxies(proxies: list[str]):
+    """
+    预解析受信任代理列表，避免每个请求重复解析
+
+    Returns:
+        tuple[frozenset[str], tuple[IPv4Network | IPv6Network, ...]]: 单个地址的字符串集合，网段列表
+    """
+    addrs: set[str] = set()
+    nets: list[IPv4Network | IPv6Network] = []
+    for proxy in proxies:
+        try:
+            if "/" in proxy:
+                nets.append(ipaddress.ip_network(proxy, strict=False))
+            else:
+                addrs.add(str(ipaddress.ip_address(proxy)))
+        except ValueError:
+            continue
+    return frozenset(addrs), tuple(nets)
+
+
+_TRUSTED_STRS, _TRUSTED_NETS = _compile_trusted_proxies(TRUSTED_PROXIES)
+
+
 def is_trusted_proxy(ip: str) -> bool:
+    if ip in _TRUSTED_STRS:
+        return True
+
     try:
         ip_addr = ipaddress.ip_address(ip)
-        for proxy in TRUSTED_PROXIES:
-            if "/" in proxy:
-                if ip_addr in ipaddress.ip_network(proxy, strict=False):
-                    return True
-            else:
-                if ip_addr == ipaddress.ip_address(proxy):
-                    return True
     except ValueError:
-        pass
-    return False
-
-
-class TrustedForwardMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next: Callable[[Request], Awaitable[Response]]) -> Response:
-        if request.client and is_trusted_proxy(request.client.host):
-            if forwarded_for := request.headers.get("X-Forwarded-For"):
-                # X-Forwarded-For can be a comma-separated list of IPs.
-                # The first one is the original client.
-                client_ip = forwarded_for.split(",")[0].strip()
-                try:
-                    ipaddress.ip_address(client_ip)
-                    request.scope["client"] = (client_ip, request.client.port)
-                except ValueError:
-                    pass
-
-        response = await call_next(request)
-        return response
+        return False
+    # 非规范写法的地址（如 IPv6 缩写差异）需按解析结果再比较一次
+    return str(ip_addr) in _TRUSTED_STRS or any(ip_addr in net for net in _TRUSTED_NETS)
+
+
+class TrustedForwardMiddleware:
+    """
+    受信任代理转发时，使用 X-Forwarded-For 中的第一个地址作为客户端地址
+
+    纯 ASGI 实现，直接读取 scope 中的原始请求头，避免 BaseHTTPMiddleware 的额外任务与流转发开销
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and (client := scope.get("client")) and is_trusted_proxy(client[0]):
+            for key, value in scope["headers"]:
+                if key == b"x-forwarded-for":
+                    # X-Forwarded-For can be a comma-separated list of IPs.
+                    # The first one is the original client.
+                    client_ip = value.split(b",", 1)[0].strip().decode("latin-1")
+                    try:
+                        ipaddress.ip_address(client_ip)
+                        scope["client"] = (client_ip, client[1])
+                    except ValueError:
+                        pass
+                    break
+
+        await self.app(scope, receive, send)
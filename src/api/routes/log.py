@@ -2,21 +2,24 @@ from __future__ import annotations
 
 import asyncio
 import json
-import time
+import os
+from operator import itemgetter
 from typing import TYPE_CHECKING, Literal
 
 import aiofiles
 from fastapi.responses import StreamingResponse
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
 from src.core.constants import DEV
 from src.core.controller import Controller
-from src.utils.logging import JSON_LOG_DIR, LogEvent, LogEventData, LogRecorder, exception_logger, system_logger
+from src.utils.logging import JSON_LOG_DIR, LogEvent, LogEventData, LogRecorder, system_logger
 
 from ..auth import current_user_depends, ensure_system_access_depends, parse_token
 from ..server import BaseResponse, Server, app
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     from loguru import Message
 
 # 不要将下方的导入移动到TYPE_CHECKING中，否则会导致fastapi无法正确生处理请求
@@ -49,14 +52,36 @@ class LogData(BaseModel):
             name=message["record"]["extra"].get("name", name),
             level=message["record"]["level"]["name"].upper(),
             extra={k: v for k, v in message["record"]["extra"].items() if k != "name"},
-            time=time.strftime("%H:%M:%S", time.localtime(message["record"]["time"]["timestamp"])),
+            # repr 形如 "2025-01-01 12:00:00.000000+08:00"，已是本地时间，直接截取时分秒
+            time=message["record"]["time"]["repr"][11:19],
         )
 
 
+# 与 logging 中 JSON 日志的文件名 webtm_{time:YYYY-MM-DD}.json 对应
+LOG_FILE_PREFIX = "webtm_"
+LOG_FILE_SUFFIX = ".json"
+
+# 直接序列化为 bytes，避免 str 的中间转换
+LOG_DATA_ADAPTER = TypeAdapter(LogData)
+
+
 @app.get("/api/log/get_list", tags=["log"])
 async def get_log_list(user: current_user_depends) -> BaseResponse[list[str]]:
-    files = sorted(JSON_LOG_DIR.glob("webtm_*.json"), key=lambda x: x.stat().st_mtime, reverse=True)
-    return BaseResponse(data=[i.stem for i in files])
+    return BaseResponse(data=await asyncio.to_thread(list_log_files))
+
+
+def list_log_files() -> list[str]:
+    """
+    按修改时间倒序列出日志文件名（不含后缀），使用 scandir 复用目录项的 stat 结果
+    """
+    entries: list[tuple[str, float]] = []
+    with os.scandir(JSON_LOG_DIR) as it:
+        for entry in it:
+            name = entry.name
+            if name.startswith(LOG_FILE_PREFIX) and name.endswith(LOG_FILE_SUFFIX) and entry.is_file():
+                entries.append((name.removesuffix(LOG_FILE_SUFFIX), entry.stat().st_mtime))
+    entries.sort(key=itemgetter(1), reverse=True)
+    return [name for name, _ in entries]
 
 
 async def realtime_log(name: str, request: Request):
@@ -73,35 +98,46 @@ async def realtime_log(name: str, request: Request):
 
     async def log_listener(data: LogEventData):
         try:
-            if data.name != name and name != "system":
-                # 不是发给当前用户的日志 / 订阅者不是 system
-                return
-
             log_data = LogData.from_message(data.message)
             await queue.put(log_data)
         except Exception:
             system_logger.exception("推送实时日志失败")
 
-    listener = LogEvent.on(log_listener)
+    # system 订阅全部日志，其余仅订阅对应名称的日志
+    listener = LogEvent.on(log_listener) if name == "system" else LogEvent.on_key(name, log_listener)
+
+    async def wait_for_disconnect():
+        while (await request.receive())["type"] != "http.disconnect":
+            pass
 
     async def event_generator():
+        disconnect_task = asyncio.create_task(wait_for_disconnect())
+        get_task: asyncio.Task[LogData | None] | None = None
         try:
-            while True:
-                try:
-                    log = await asyncio.wait_for(queue.get(), timeout=0.1)
+            while not disconnect_task.done():
+                if get_task is None:
+                    get_task = asyncio.create_task(queue.get())
+
+                # 有新日志或连接断开时立即唤醒，否则每 0.5 秒检查一次程序是否停止
+                await asyncio.wait((get_task, disconnect_task), timeout=0.5, return_when=asyncio.FIRST_COMPLETED)
+
+                if get_task.done():
+                    log = get_task.result()
+                    get_task = None
                     if log is None:
-                        yield "data: [DONE]\n\n"
-                        continue
+                        yield b"data: [DONE]\n\n"
+                    else:
+                        yield b"data: " + LOG_DATA_ADAPTER.dump_json(log) + b"\n\n"
 
-                    yield f"data: {json.dumps(log.model_dump(), ensure_ascii=False)}\n\n"
-                except TimeoutError:
-                    pass
-                if await request.is_disconnected() or not Controller.running or Server.should_exit():
+                if not Controller.running or Server.should_exit():
                     break
         except Exception:
             system_logger.exception("推送实时日志失败")
         finally:
             listener.un_register()
+            disconnect_task.cancel()
+            if get_task is not None:
+                get_task.cancel()
 
     return StreamingResponse(event_generator(), media_type="text/event-stream")
 
@@ -122,15 +158,25 @@ async def system_realtime_log(request: Request, token: str) -> StreamingResponse
     return await realtime_log("system", request)
 
 
-async def get_log(target_name: str, file: str):
-    path = JSON_LOG_DIR / f"{file}.json"
-    if not path.exists() or not path.is_file():
-        return BaseResponse(data=[], message="日志文件不存在", code=400)
-
-    logs = []
-    with exception_logger("读取日志文件失败", reraise=False):
-        async with aiofiles.open(path, encoding="utf-8") as f:
+async def iter_log_json(path: Path, target_name: str):
+    """
+    逐行读取日志文件并以 BaseResponse[list[LogData]] 的 JSON 格式分块输出，避免一次性构造全部日志
+    """
+    yield b'{"code":200,"message":null,"data":['
+    first = True
+    # loguru 序列化时 extra.name 形如 "name": "user.xxx"，先按字节匹配，跳过明显无关的行，减少 JSON 解析
+    needle = (
+        None
+        if target_name in ("system", "unknown")
+        else f'"name": {json.dumps(target_name, ensure_ascii=False)}'.encode()
+    )
+    try:
+        f = await aiofiles.open(path, "rb")
+        try:
             async for line in f:
+                if needle is not None and needle not in line:
+                    continue
+
                 log = json.loads(line)
                 name = log["record"]["extra"].get("name", "unknown")
 
@@ -138,17 +184,35 @@ async def get_log(target_name: str, file: str):
                     # 不是当前用户的日志 / 订阅者不是 system
                     continue
 
-                logs.append(LogData.from_json_message(log))
+                data = LOG_DATA_ADAPTER.dump_json(LogData.from_json_message(log))
+                if first:
+                    first = False
+                    yield data
+                else:
+                    yield b"," + data
+        finally:
+            await f.close()
+    except Exception as e:
+        # 出错时仍输出已读取的部分，保持 JSON 完整
+        system_logger.exception(f"读取日志文件失败: {e}")
+    yield b"]}"
+
+
+async def get_log(target_name: str, file: str) -> StreamingResponse:
+    path = JSON_LOG_DIR / f"{file}{LOG_FILE_SUFFIX}"
+    if not path.exists() or not path.is_file():
+        error = BaseResponse(data=[], message="日志文件不存在", code=400)
+        return StreamingResponse(iter([error.model_dump_json()]), media_type="application/json")
 
-    return BaseResponse(data=logs)
+    return StreamingResponse(iter_log_json(path, target_name), media_type="application/json")
 
 
-@app.get("/api/log/get", tags=["log"])
-async def get_user_log(user: current_user_depends, file: str) -> BaseResponse[list[LogData]]:
+@app.get("/api/log/get", tags=["log"], response_model=BaseResponse[list[LogData]])
+async def get_user_log(user: current_user_depends, file: str) -> StreamingResponse:
     user_name = f"user.{user.username}"
     return await get_log(user_name, file)
 
 
-@app.get("/api/system/log/get", tags=["system", "log"])
-async def get_system_log(system_access: ensure_system_access_depends, file: str) -> BaseResponse[list[LogData]]:
+@app.get("/api/system/log/get", tags=["system", "log"], response_model=BaseResponse[list[LogData]])
+async def get_system_log(system_access: ensure_system_access_depends, file: str) -> StreamingResponse:
     return await get_log("system", file)
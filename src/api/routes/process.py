@@ -1,10 +1,12 @@
+import itertools
 import math
+from collections.abc import Iterator, Sequence
 from datetime import datetime, timedelta
-from typing import Literal
+from typing import Any, ClassVar, Literal
 
 from fastapi import HTTPException
-from pydantic import BaseModel
-from sqlalchemy import func, select
+from pydantic import BaseModel, PrivateAttr
+from sqlalchemy import and_, func, select
 
 from src.db import Database
 from src.models import ProcessContextModel, ProcessLogModel
@@ -29,10 +31,7 @@ UNKNOWN_CONTENT = Post(
 
 
 def make_unknown_content(pid: int, tid: int = 0) -> Content:
-    copy = UNKNOWN_CONTENT.model_copy()
-    copy.pid = pid
-    copy.tid = tid
-    return copy
+    return UNKNOWN_CONTENT.model_copy(update={"pid": pid, "tid": tid})
 
 
 class ProcessCountData(BaseModel):
@@ -47,11 +46,12 @@ async def get_overview(user: current_user_depends) -> BaseResponse[ProcessCountD
     now = datetime.now()
     since = now - timedelta(hours=24)
     async with Database.get_session() as session:
-        # 查询过去24小时内所有处理日志
+        # 按规则与白名单状态统计过去24小时内的处理日志
         result = await session.execute(
-            select(ProcessLogModel.result_rule, ProcessLogModel.is_whitelist)
+            select(ProcessLogModel.result_rule, ProcessLogModel.is_whitelist, func.count())
             .where(ProcessLogModel.process_time >= since)
             .where(ProcessLogModel.user == user.username)
+            .group_by(ProcessLogModel.result_rule, ProcessLogModel.is_whitelist)
         )
         rows = result.all()
 
@@ -62,15 +62,16 @@ async def get_overview(user: current_user_depends) -> BaseResponse[ProcessCountD
         )
         hint_rules = [row[0] for row in result.all()]
 
-    total_count = len(rows)
+    total_count = 0
     hit_rule_count: dict[str, int] = {}
     whitelist_count: dict[str, int] = {}
 
-    for rule, is_whitelist in rows:
+    for rule, is_whitelist, count in rows:
+        total_count += count
         if is_whitelist is True:
-            whitelist_count[rule] = whitelist_count.get(rule, 0) + 1
+            whitelist_count[rule] = count
         elif is_whitelist is False:
-            hit_rule_count[rule] = hit_rule_count.get(rule, 0) + 1
+            hit_rule_count[rule] = count
 
     return BaseResponse(
         data=ProcessCountData(
@@ -88,11 +89,19 @@ class ProcessData(BaseModel):
     process_time: int
     content: Content | None
 
+    # 无内容时使用的负数标识，与 pid 不会冲突（从 -2 开始，CPython 中 hash(-1) == hash(-2)）
+    _anon_ids: ClassVar[Iterator[int]] = itertools.count(-2, -1)
+    _anon_id: int = PrivateAttr(default=0)
+
+    def model_post_init(self, context: Any, /) -> None:
+        if self.content is None:
+            self._anon_id = next(ProcessData._anon_ids)
+
     def __hash__(self) -> int:
         """
         仅用于同user的判断，不同user不能混用
         """
-        return self.content.pid if self.content else hash(id(self))
+        return self.content.pid if self.content else self._anon_id
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, ProcessData):
@@ -102,19 +111,25 @@ class ProcessData(BaseModel):
         return self is other
 
 
-async def attach_content(logs: list[ProcessLogModel]) -> list[ProcessData]:
+async def attach_content(logs: Sequence[ProcessLogModel]) -> list[ProcessData]:
     contents = await Database.get_full_contents_by_pids([log.pid for log in logs])
     pid_to_content = {content.pid: content for content in contents}
 
-    return [
-        ProcessData(
-            result_rule=log.result_rule,
-            process_time=int(log.process_time.timestamp()),
-            is_whitelist=log.is_whitelist or False,
-            content=pid_to_content[log.pid] if log.pid in pid_to_content else make_unknown_content(log.pid, log.tid),
+    # 字段均来自数据库模型与已校验的内容，跳过校验直接构造
+    data = []
+    for log in logs:
+        content = pid_to_content.get(log.pid)
+        if content is None:
+            content = make_unknown_content(log.pid, log.tid)
+        data.append(
+            ProcessData.model_construct(
+                result_rule=log.result_rule,
+                process_time=int(log.process_time.timestamp()),
+                is_whitelist=log.is_whitelist or False,
+                content=content,
+            )
         )
-        for log in logs
-    ]
+    return data
 
 
 class SearchParams(BaseModel):
@@ -173,13 +188,13 @@ async def search_process(request: SearchRequest, user: current_user_depends) ->
         offset = (request.page - 1) * request.page_size
         sql = base_sql.order_by(ProcessLogModel.process_time.desc()).offset(offset).limit(request.page_size)
         result = await session.execute(sql)
-        logs = list(result.scalars().all())
+        logs = result.scalars().all()
 
     result = await attach_content(logs)
 
     return BaseResponse(
         data=SearchResponse(
-            data=sorted(result, key=lambda x: x.process_time, reverse=True),
+            data=result,  # 已在 SQL 中按处理时间倒序排列
             page=PageInfo(total=total, page_count=math.ceil(total / request.page_size)),
         )
     )
@@ -197,7 +212,7 @@ async def query_process_context(pid: int, user: current_user_depends):
             .where(ProcessLogModel.pid == pid, ProcessLogModel.user == user.username)
             .join(
                 ProcessContextModel,
-                (ProcessLogModel.pid == ProcessContextModel.pid) & (ProcessLogModel.user == ProcessContextModel.user),
+                and_(ProcessLogModel.pid == ProcessContextModel.pid, ProcessLogModel.user == ProcessContextModel.user),
             )
         )
         return result.first()
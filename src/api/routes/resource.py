@@ -1,23 +1,41 @@
 from __future__ import annotations
 
 import asyncio
-import io
+import os
+import re
+import time
 from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import TYPE_CHECKING, Literal
 
+import aiofiles
+import aiofiles.os
 import cv2
 from fastapi import HTTPException
-from fastapi.responses import StreamingResponse
+from fastapi.responses import FileResponse, Response
 
+from src.core.constants import CACHE_DIR
 from src.core.controller import Controller
 from src.utils.anonymous import AnoymousTiebaMeow
+from src.utils.cache import ClearCache
 from src.utils.logging import exception_logger
+from src.utils.tools import single_flight, write_bytes
 
 from ..server import app
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
     import numpy as np
 
+PORTRAIT_CACHE = CACHE_DIR / "resources" / "portrait"
+IMAGE_CACHE = CACHE_DIR / "resources" / "image"  # 目录在首次写入缓存时创建
+
+IMAGE_CACHE_EXPIRE = 86400  # 与 Cache-Control 的 max-age 保持一致
+IMAGE_HEADERS = {"Cache-Control": "public, max-age=86400"}
+IMAGE_KEY_PATTERN = re.compile(r"[\w.\-]+")
+loading_images: dict[Path, asyncio.Future[bytes | memoryview | None]] = {}
+
 
 class ResourceAPIExecutorManager:
     executor: ThreadPoolExecutor | None = None
@@ -36,38 +54,104 @@ class ResourceAPIExecutorManager:
             cls.executor = None
 
 
-def ndarray2image(image: np.ndarray | None) -> io.BytesIO:
-    if image is None or not image.any():
-        image_bytes = b""
+# cv2 默认质量为 100，头像与图片预览使用 75 即可，体积显著减小且无明显画质损失
+WEBP_ENCODE_PARAMS = [cv2.IMWRITE_WEBP_QUALITY, 75]
+
+
+def ndarray2image(image: np.ndarray | None) -> bytes | memoryview:
+    # aiotieba 获取失败时返回空数组，只需判断大小，无需扫描整个图像
+    if image is None or image.size == 0:
+        return b""
+    # 直接返回编码缓冲区的一维字节视图，避免 tobytes 复制
+    return memoryview(cv2.imencode(".webp", image, WEBP_ENCODE_PARAMS)[1]).cast("B")
+
+
+def remove_expired_image_cache(expire: float = IMAGE_CACHE_EXPIRE) -> None:
+    deadline = time.time() - expire
+    for directory in (PORTRAIT_CACHE, IMAGE_CACHE):
+        try:
+            it = os.scandir(directory)
+        except FileNotFoundError:
+            # 尚未写入过缓存
+            continue
+        with it:
+            for entry in it:
+                with exception_logger(f"删除过期图片缓存失败 {entry.name}"):
+                    if entry.is_file() and entry.stat().st_mtime < deadline:
+                        Path(entry.path).unlink()
+
+
+async def clear_image_cache(_: None = None) -> None:
+    await asyncio.to_thread(remove_expired_image_cache)
+
+
+ClearCache.on(clear_image_cache)
+
+
+def get_image_cache_path(directory: Path, key: str, size: str) -> Path | None:
+    # 仅缓存安全的文件名，避免路径穿越
+    if not IMAGE_KEY_PATTERN.fullmatch(key):
+        return None
+    return directory / f"{key}_{size}.webp"
+
+
+async def encode_image(fetch: Callable[[], Awaitable[np.ndarray | None]]) -> bytes | memoryview:
+    image = await fetch()
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(ResourceAPIExecutorManager.get_executor(), ndarray2image, image)
+
+
+async def load_image(cache_path: Path, fetch: Callable[[], Awaitable[np.ndarray | None]]) -> bytes | memoryview | None:
+    """
+    获取并编码图片后写入磁盘缓存，缓存已存在时返回 None，获取失败时返回空字节且不写入缓存
+    """
+    if await aiofiles.os.path.isfile(cache_path):
+        return None
+
+    image_bytes = await encode_image(fetch)
+    if image_bytes:
+        with exception_logger("写入图片缓存失败"):
+            # 原子写入，避免中断后残留不完整的缓存被当作命中
+            await write_bytes(cache_path, image_bytes)
+    return image_bytes
+
+
+async def image_response(cache_path: Path | None, fetch: Callable[[], Awaitable[np.ndarray | None]]) -> Response:
+    """
+    优先返回磁盘缓存的图片，未命中时获取并编码，同一图片的并发请求只获取一次
+    获取失败时返回 502 且不带缓存头，避免浏览器与代理缓存空图片
+    """
+    if cache_path is None:
+        image_bytes = await encode_image(fetch)
     else:
-        image_bytes = cv2.imencode(".webp", image)[1].tobytes()
+        image_bytes = await single_flight(loading_images, cache_path, lambda: load_image(cache_path, fetch))
+        if image_bytes is None:
+            return FileResponse(cache_path, media_type="image/webp", headers=IMAGE_HEADERS)
 
-    return io.BytesIO(image_bytes)
+    if not image_bytes:
+        raise HTTPException(status_code=502, detail="获取图片失败")
+    return Response(content=image_bytes, media_type="image/webp", headers=IMAGE_HEADERS)
 
 
 @app.get("/resources/portrait/{portrait}", tags=["resources"])
-async def get_portrait(portrait: str, size: Literal["s", "m", "l"] = "s") -> StreamingResponse:
+async def get_portrait(portrait: str, size: Literal["s", "m", "l"] = "s") -> Response:
     if not Controller.running:
         raise HTTPException(status_code=503, detail="Service Unavailable")
-    with exception_logger("获取头像失败"):
-        image = await (await AnoymousTiebaMeow.client()).get_portrait(portrait, size=size)
-    loop = asyncio.get_running_loop()
-    return StreamingResponse(
-        content=await loop.run_in_executor(ResourceAPIExecutorManager.get_executor(), ndarray2image, image.img),
-        media_type="image/webp",
-        headers={"Cache-Control": "public, max-age=86400"},
-    )
+
+    async def fetch():
+        with exception_logger("获取头像失败"):
+            return (await (await AnoymousTiebaMeow.client()).get_portrait(portrait, size=size)).img
+
+    return await image_response(get_image_cache_path(PORTRAIT_CACHE, portrait, size), fetch)
 
 
 @app.get("/resources/image/{hash}", tags=["resources"])
-async def get_image(hash: str, size: Literal["s", "m", "l"] = "s") -> StreamingResponse:  # noqa: A002
+async def get_image(hash: str, size: Literal["s", "m", "l"] = "s") -> Response:  # noqa: A002
     if not Controller.running:
         raise HTTPException(status_code=503, detail="Service Unavailable")
-    with exception_logger("获取图片失败"):
-        image = await (await AnoymousTiebaMeow.client()).hash2image(hash, size=size)
-    loop = asyncio.get_running_loop()
-    return StreamingResponse(
-        content=await loop.run_in_executor(ResourceAPIExecutorManager.get_executor(), ndarray2image, image.img),
-        media_type="image/webp",
-        headers={"Cache-Control": "public, max-age=86400"},
-    )
+
+    async def fetch():
+        with exception_logger("获取图片失败"):
+            return (await (await AnoymousTiebaMeow.client()).hash2image(hash, size=size)).img
+
+    return await image_response(get_image_cache_path(IMAGE_CACHE, hash, size), fetch)
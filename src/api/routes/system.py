@@ -48,7 +48,9 @@ async def get_users_info(system_access: ensure_system_access_depends) -> BaseRes
         for user in UserManager.users.values()
     ]
     existed_code = {u.config.user.code for u in UserManager.users.values()}
-    data.extend(info for key, info in await CodeCache.items() if key not in existed_code)
+    async for key, info in CodeCache.iter_items():
+        if key not in existed_code:
+            data.append(info)
     return BaseResponse(data=data)
 
 
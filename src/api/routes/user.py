@@ -11,9 +11,10 @@ from src.rule.operation import Operations
 from src.schemas.rule import ConditionInfo, OperationInfo  # noqa: TC001
 
 # 不要将下方的导入移动到TYPE_CHECKING中，否则会导致fastapi无法正确生处理请求
-from src.schemas.user import ConfirmSimpleData, UserPermission  # noqa: TC001
+from src.schemas.user import ConfirmData, ConfirmSimpleData, UserPermission  # noqa: TC001
 from src.user.manager import User, UserManager
 from src.user.user import TiebaClientStatus
+from src.utils.logging import exception_logger
 
 from ..auth import current_user_depends, system_access_depends  # noqa: TC001
 from ..server import BaseResponse, app
@@ -88,16 +89,14 @@ async def get_user_config(user: current_user_depends) -> BaseResponse[UserConfig
 async def set_user_config(
     user: current_user_depends, system_access: system_access_depends, req: UserConfigData
 ) -> BaseResponse[bool]:
-    config = user.config.model_copy(deep=True)
-
     mosaic_forum = user.config.forum.mosaic
     if req.forum.bduss == mosaic_forum.bduss:
         req.forum.bduss = user.config.forum.bduss
     if req.forum.stoken == mosaic_forum.stoken:
         req.forum.stoken = user.config.forum.stoken
 
-    config.forum = req.forum
-    config.process = req.process
+    # 仅替换修改的字段，其余字段与原配置共享引用，避免深拷贝整个配置
+    config = user.config.model_copy(update={"forum": req.forum, "process": req.process})
     try:
         await UserManager.update_config(config, system_access=system_access)
     except PermissionError as e:
@@ -130,8 +129,7 @@ async def get_rules(user: current_user_depends) -> BaseResponse[list[RuleConfig]
 async def set_rules(
     user: current_user_depends, system_access: system_access_depends, rules: list[RuleConfig]
 ) -> BaseResponse[bool]:
-    config = user.config.model_copy(deep=True)
-    config.rules = rules
+    config = user.config.model_copy(update={"rules": rules})
     try:
         await UserManager.update_config(config, system_access=system_access)
     except PermissionError as e:
@@ -152,10 +150,22 @@ class ConfirmRequest(BaseModel):
     action: Literal["ignore", "execute"]
 
 
+CONFIRM_CONCURRENCY = 8
+
+
 async def confirm_many(user: User, pids: list[int], action: Literal["ignore", "execute"]):
-    confirms = [confirm for pid in pids if (confirm := await user.confirm.get(pid))]
-    for confirm in confirms:
-        await user.operate_confirm(confirm, action)
+    confirms = await asyncio.gather(*(user.confirm.get(pid) for pid in pids))
+    semaphore = asyncio.Semaphore(CONFIRM_CONCURRENCY)
+
+    async def _operate(confirm: ConfirmData):
+        # 单个确认失败仅记录日志，不影响其余确认的执行；账号未登录的 ValueError 已由 operate_confirm 记录警告
+        async with semaphore:
+            with exception_logger(
+                f"执行确认操作失败 pid={confirm.content.pid}", logger=user.logger, ignore_exceptions=(ValueError,)
+            ):
+                await user.operate_confirm(confirm, action)
+
+    await asyncio.gather(*(_operate(confirm) for confirm in confirms if confirm))
 
 
 @app.post("/api/confirm/confirm", tags=["confirm"])
@@ -1,14 +1,28 @@
 import asyncio
 import mimetypes
+import mmap
+import re
+import stat
+import struct
+import threading
+import time
 import zipfile
+import zlib
+from collections import OrderedDict
+from collections.abc import Callable, Mapping
+from contextlib import suppress
 from dataclasses import dataclass
+from hashlib import blake2b
 from pathlib import Path, PurePosixPath
+from uuid import uuid4
 
 import aiofiles
+import aiofiles.os
 import aiohttp
 from fastapi import HTTPException, Request, Response
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, StreamingResponse
 from pydantic import BaseModel
+from starlette.types import Receive, Scope, Send
 
 from src.core.constants import (
     CACHE_DIR,
@@ -22,17 +36,28 @@ from src.core.constants import (
     WEBUI_ZIP_OVERRIDE,
 )
 from src.utils.anonymous import AnonymousAiohttp
-from src.utils.logging import system_logger
-from src.utils.tools import Timer
+from src.utils.logging import exception_logger, system_logger
+from src.utils.tools import Timer, single_flight, write_bytes
 
 from ..server import Server, app
 
 WEBUI_CACHE = CACHE_DIR / "webui"
 WEBUI_CACHE.mkdir(parents=True, exist_ok=True)
 
+# RESOURCE_DIR 在定义时已解析为绝对路径，此处无需再次 resolve
+RESOURCE_ROOT = RESOURCE_DIR
+
+# 仅允许由字母、数字、下划线、点与短横线组成的相对路径，且不含上级目录引用
+SAFE_RESOURCE_PATH = re.compile(r"(?!.*\.\.)[\w.\-]+(?:/[\w.\-]+)*", re.ASCII)
+
 DOWNLOADABLE_RESOURCES = {"Sarasa-Mono-SC-Nerd.woff2"}
 VALID_RESOURCES = {"Sarasa-Mono-SC-Nerd.woff2"}
-downloading_resources = {}
+VALID_RESOURCE_PATHS = {name: RESOURCE_ROOT / name for name in VALID_RESOURCES}
+downloading_resources: dict[Path, asyncio.Future[bytes | None]] = {}
+# 正在边转发边写入缓存的 assets，并发请求等待其完成后直接读取缓存
+caching_assets: dict[Path, asyncio.Event] = {}
+# 等待首个请求写入缓存的最长时间，超时后自行转发
+CACHING_ASSET_WAIT_TIMEOUT = 30
 
 if WEBUI_SERVER:
     WEBUI_BASE = WEBUI_SERVER.rstrip("/")
@@ -60,10 +85,37 @@ if WEBUI_ZIP_OVERRIDE:
 LOCAL_OVERRIDE_ENABLED = LOCAL_WEBUI_DIR is not None or LOCAL_WEBUI_ZIP is not None
 
 
+# Vite 构建产物的扩展名固定且有限，直接查表，未知扩展名再交由 mimetypes 推断
+ASSET_MEDIA_TYPES = {
+    ".js": "application/javascript",
+    ".mjs": "application/javascript",
+    ".css": "text/css",
+    ".html": "text/html",
+    ".json": "application/json",
+    ".map": "application/json",
+    ".woff2": "font/woff2",
+    ".woff": "font/woff",
+    ".svg": "image/svg+xml",
+    ".png": "image/png",
+    ".webp": "image/webp",
+    ".ico": "image/x-icon",
+}
+# 启动时加载系统 MIME 数据库，避免首次请求时才初始化
+mimetypes.init()
+
+
+def guess_media_type(name: str) -> str | None:
+    _, dot, ext = name.rpartition(".")
+    if dot and (media_type := ASSET_MEDIA_TYPES.get(f".{ext.lower()}")):
+        return media_type
+    return mimetypes.guess_type(name)[0]
+
+
 @dataclass
 class LocalAsset:
     data: bytes
     media_type: str | None
+    etag: str | None = None
 
 
 def _normalize_relative_path(rel_path: str) -> str | None:
@@ -82,78 +134,232 @@ async def _read_from_local_dir(normalized_path: str) -> LocalAsset | None:
     if LOCAL_WEBUI_DIR is None:
         return None
 
-    base_dir = LOCAL_WEBUI_DIR.resolve()
+    base_dir = LOCAL_WEBUI_DIR
 
-    try:
-        file_path = (base_dir / normalized_path).resolve(strict=True)
-    except FileNotFoundError:
-        return None
+    def _load() -> LocalAsset | None:
+        # 路径校验与读取在同一次线程调度中完成
+        try:
+            file_path = (base_dir / normalized_path).resolve(strict=True)
+        except FileNotFoundError:
+            return None
 
-    if not file_path.is_relative_to(base_dir) or not file_path.is_file():
-        return None
+        if not file_path.is_relative_to(base_dir) or not file_path.is_file():
+            return None
+        return LocalAsset(data=file_path.read_bytes(), media_type=guess_media_type(file_path.name))
 
-    async with aiofiles.open(file_path, "rb") as f:
-        data = await f.read()
+    return await asyncio.to_thread(_load)
 
-    media_type = mimetypes.guess_type(file_path.name)[0]
-    return LocalAsset(data=data, media_type=media_type)
 
+class WebUIZip:
+    """
+    常驻打开并内存映射的 WebUI 压缩包，避免每次请求都重新解析中央目录
 
-async def _read_from_zip(normalized_path: str) -> LocalAsset | None:
-    zip_path = LOCAL_WEBUI_ZIP
-    if zip_path is None:
-        return None
+    未加密的 stored/deflated 条目直接从映射内存中切片或解压，其余条目交由 ZipFile 读取
+    """
+
+    archive: zipfile.ZipFile | None = None
+    mapping: mmap.mmap | None = None
+    # 文件名 -> ZipInfo，打开时构建一次，缺失的条目无需通过 KeyError 判断
+    entries: dict[str, zipfile.ZipInfo] | None = None
+    lock = threading.Lock()
 
-    def _load_from_zip() -> bytes | None:
+    @classmethod
+    def _open(cls, zip_path: Path):
+        with zip_path.open("rb") as f:
+            mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
         try:
-            with zipfile.ZipFile(zip_path, "r") as archive:
-                with archive.open(normalized_path) as file:
-                    return file.read()
+            cls.archive = zipfile.ZipFile(zip_path, "r")
+        except BaseException:
+            mapping.close()
+            raise
+        cls.mapping = mapping
+        cls.entries = {info.filename: info for info in cls.archive.infolist()}
+
+    @classmethod
+    def _read_mapped(cls, info: zipfile.ZipInfo) -> bytes | None:
+        mapping = cls.mapping
+        if mapping is None or info.flag_bits & 0x1:
+            return None
+        if info.compress_type not in (zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED):
+            return None
+
+        # 本地文件头固定 30 字节，其后为文件名与扩展字段，长度以本地文件头中的为准
+        header = mapping[info.header_offset : info.header_offset + 30]
+        if len(header) != 30 or header[:4] != b"PK\x03\x04":
+            raise zipfile.BadZipFile(f"Bad local file header: {info.filename}")
+        name_length, extra_length = struct.unpack_from("<HH", header, 26)
+        start = info.header_offset + 30 + name_length + extra_length
+        raw = mapping[start : start + info.compress_size]
+
+        data = raw if info.compress_type == zipfile.ZIP_STORED else zlib.decompress(raw, -zlib.MAX_WBITS)
+        if zlib.crc32(data) != info.CRC:
+            raise zipfile.BadZipFile(f"Bad CRC-32 for file {info.filename}")
+        return data
+
+    @classmethod
+    def _read(cls, zip_path: Path, name: str) -> bytes | None:
+        with cls.lock:
+            if cls.archive is None:
+                cls._open(zip_path)
+            if (info := cls.entries.get(name)) is None:  # type: ignore
+                return None
+            if (data := cls._read_mapped(info)) is not None:
+                return data
+            with cls.archive.open(info) as file:  # type: ignore
+                return file.read()
+
+    @classmethod
+    def read(cls, zip_path: Path, name: str) -> bytes | None:
+        try:
+            return cls._read(zip_path, name)
         except FileNotFoundError:
             system_logger.error(f"WebUI 压缩包在运行时丢失: {zip_path}")
             return None
-        except KeyError:
-            system_logger.error(f"WebUI 资源在压缩包中不存在: {normalized_path} in {zip_path}")
-            return None
-        except (zipfile.BadZipFile, OSError):
+        except (zipfile.BadZipFile, zlib.error, OSError, ValueError):
             system_logger.error(f"WebUI 压缩包损坏或无法读取: {zip_path}")
+            # 下次读取时重新打开压缩包
+            cls.close()
             return None
 
-    data = await asyncio.to_thread(_load_from_zip)
+    @classmethod
+    def close(cls, _=None):
+        with cls.lock:
+            if cls.archive is not None:
+                cls.archive.close()
+                cls.archive = None
+            if cls.mapping is not None:
+                cls.mapping.close()
+                cls.mapping = None
+            cls.entries = None
+
+
+async def _read_from_zip(normalized_path: str) -> LocalAsset | None:
+    zip_path = LOCAL_WEBUI_ZIP
+    if zip_path is None:
+        return None
+
+    # 压缩包已打开时，不存在的条目直接返回，无需调度到线程
+    if (entries := WebUIZip.entries) is not None and normalized_path not in entries:
+        return None
+
+    data = await asyncio.to_thread(WebUIZip.read, zip_path, normalized_path)
     if data is None:
         return None
 
-    media_type = mimetypes.guess_type(PurePosixPath(normalized_path).name)[0]
+    media_type = guess_media_type(PurePosixPath(normalized_path).name)
     return LocalAsset(data=data, media_type=media_type)
 
 
+class AssetMemoryCache:
+    """
+    WebUI 资源的内存 LRU 缓存，运行期间 WebUI 资源不会变化，首次读取后直接从内存返回
+
+    Attributes:
+        max_size (int): 缓存内容的总字节数上限
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.assets: OrderedDict[str, LocalAsset] = OrderedDict()
+        self.size = 0
+
+    def get(self, path: str) -> LocalAsset | None:
+        if (asset := self.assets.get(path)) is not None:
+            self.assets.move_to_end(path)
+        return asset
+
+    def set(self, path: str, asset: LocalAsset):
+        if len(asset.data) > self.max_size:
+            return
+
+        if (old := self.assets.pop(path, None)) is not None:
+            self.size -= len(old.data)
+        self.assets[path] = asset
+        self.size += len(asset.data)
+
+        while self.size > self.max_size:
+            _, evicted = self.assets.popitem(last=False)
+            self.size -= len(evicted.data)
+
+
+# 本地目录或压缩包中的 WebUI 资源
+local_asset_cache = AssetMemoryCache(64 * 1024 * 1024)
+# 从上游缓存到磁盘的 assets，仅缓存较小的文件，较大的文件仍由 FileResponse 发送
+cached_asset_cache = AssetMemoryCache(32 * 1024 * 1024)
+CACHED_ASSET_MEMORY_LIMIT = 2 * 1024 * 1024
+# 正在从本地目录或压缩包读取的资源，同一路径的并发请求只读取一次
+loading_local_assets: dict[str, asyncio.Future[LocalAsset | None]] = {}
+
+
 async def load_local_asset(rel_path: str) -> LocalAsset | None:
     normalized_path = _normalize_relative_path(rel_path)
     if not normalized_path:
         return None
 
-    asset = await _read_from_local_dir(normalized_path)
-    if asset:
+    # 缓存的读写不含 await，在事件循环中不会交错，无需加锁；读取文件时不阻塞其他路径
+    if asset := local_asset_cache.get(normalized_path):
         return asset
+    return await single_flight(loading_local_assets, normalized_path, lambda: _load_local_asset(normalized_path))
+
+
+async def _load_local_asset(normalized_path: str) -> LocalAsset | None:
+    asset = await _read_from_local_dir(normalized_path) or await _read_from_zip(normalized_path)
+    if asset:
+        asset.etag = content_etag(asset.data)
+        local_asset_cache.set(normalized_path, asset)
+    return asset
+
+
+# 转发给上游的请求头，Accept-Encoding 由 aiohttp 自行协商并解压
+FORWARD_REQUEST_HEADERS = frozenset({
+    "user-agent",
+    "accept",
+    "accept-language",
+    "range",
+    "if-none-match",
+    "if-modified-since",
+})
+# 不返回给客户端的上游响应头（内容已被 aiohttp 解压，长度与编码由本服务重新设置）
+DROP_RESPONSE_HEADERS = frozenset({"transfer-encoding", "content-encoding", "server", "date", "content-length"})
+
+
+# 条件请求与范围请求头，刷新共享缓存时不应转发，否则上游可能按单个客户端返回 304/206
+CONDITIONAL_REQUEST_HEADERS = frozenset({"range", "if-none-match", "if-modified-since"})
+
+# ASGI 原始请求头为小写 bytes，直接按 bytes 过滤，只解码需要转发的请求头
+FORWARD_REQUEST_HEADERS_RAW = frozenset(header.encode("latin-1") for header in FORWARD_REQUEST_HEADERS)
+FORWARD_UNCONDITIONAL_HEADERS_RAW = frozenset(
+    header.encode("latin-1") for header in FORWARD_REQUEST_HEADERS - CONDITIONAL_REQUEST_HEADERS
+)
+
 
-    return await _read_from_zip(normalized_path)
+def forward_request_headers(request: Request, conditional: bool = True) -> dict[str, str]:
+    """
+    Args:
+        conditional (bool): 是否转发条件请求与范围请求头
+    """
+    allowed = FORWARD_REQUEST_HEADERS_RAW if conditional else FORWARD_UNCONDITIONAL_HEADERS_RAW
+    return {key.decode("latin-1"): value.decode("latin-1") for key, value in request.headers.raw if key in allowed}
 
 
-async def reverse_proxy(url: str, request: Request, raw=False):
+def filter_response_headers(headers: Mapping[str, str]) -> dict[str, str]:
+    return {key: value for key, value in headers.items() if key.lower() not in DROP_RESPONSE_HEADERS}
+
+
+async def reverse_proxy(url: str, request: Request, conditional: bool = True):
+    """
+    读取完整响应体的反向代理，仅用于需要缓存或改写内容的小文件（如 index.html），其余资源使用 stream_proxy
+
+    Args:
+        conditional (bool): 是否转发客户端的条件请求与范围请求头，刷新共享缓存时应为 False
+    """
     system_logger.debug(f"反向代理请求: {url}")
     try:
         session = await AnonymousAiohttp.session()
-        headers = {key: value for key, value in request.headers.items() if key != "host"}
+        headers = forward_request_headers(request, conditional)
         async with session.get(url, headers=headers) as resp:
             data = await resp.read()
-            headers = dict(resp.headers)
-
-            if raw:
-                return data, resp.status, headers
-
-            for h in ["Transfer-Encoding", "Content-Encoding", "Server", "Date", "Content-Length"]:
-                headers.pop(h, None)
-            return data, resp.status, headers
+            return data, resp.status, filter_response_headers(resp.headers)
     except TimeoutError as e:
         system_logger.error(f"网页资源请求超时: {e}")
         raise HTTPException(status_code=504, detail="Gateway Timeout") from e
@@ -165,39 +371,352 @@ async def reverse_proxy(url: str, request: Request, raw=False):
         raise HTTPException(status_code=500, detail="Internal Server Error") from e
 
 
-async def download_resource(path: Path):
-    if path in downloading_resources:
-        event = downloading_resources[path]
-        await event.wait()
-        if path.exists():
-            async with aiofiles.open(path, "rb") as f:
-                return await f.read()
-        return None
+STREAM_CHUNK_SIZE = 64 * 1024
+CACHE_WRITE_BUFFER_SIZE = 1024 * 1024
+
+
+class ProxyStreamingResponse(StreamingResponse):
+    """
+    无论响应是否成功发送都会调用 on_close 的 StreamingResponse
 
+    客户端在响应开始前断开时，响应体迭代器不会启动，后台任务也不会执行，
+    需在 __call__ 结束时兜底释放上游连接与缓存占位
+    """
+
+    def __init__(self, *args, on_close: Callable[[], None], **kwargs):
+        super().__init__(*args, **kwargs)
+        self.on_close = on_close
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            self.on_close()
+
+
+async def stream_proxy(
+    url: str,
+    request: Request,
+    extra_headers: Mapping[str, str] | None = None,
+    cache_path: Path | None = None,
+    on_complete: Callable[[], None] | None = None,
+) -> StreamingResponse:
+    """
+    流式反向代理，边接收上游数据边转发，适用于无需改写内容的资源
+
+    Args:
+        extra_headers (Mapping[str, str] | None): 附加到响应中的响应头
+        cache_path (Path | None): 上游返回 200 时，将内容边转发边写入该路径，写入完成后才原子替换到位
+        on_complete (Callable[[], None] | None): 转发结束（含失败）后调用，仅调用一次
+    """
+    system_logger.debug(f"流式反向代理请求: {url}")
+    try:
+        session = await AnonymousAiohttp.session()
+        headers = forward_request_headers(request)
+        resp = await session.get(url, headers=headers)
+    except TimeoutError as e:
+        system_logger.error(f"网页资源请求超时: {e}")
+        raise HTTPException(status_code=504, detail="Gateway Timeout") from e
+    except aiohttp.ClientError as e:
+        system_logger.error(f"网页资源请求失败: {e}")
+        raise HTTPException(status_code=502, detail="Bad Gateway") from e
+
+    if resp.status != 200:
+        cache_path = None
+
+    completed = False
+
+    def complete():
+        nonlocal completed
+        resp.release()
+        if not completed:
+            completed = True
+            if on_complete is not None:
+                on_complete()
+
+    async def iter_content():
+        tmp_path = None
+        f = None
+        try:
+            if cache_path is not None:
+                await aiofiles.os.makedirs(cache_path.parent, exist_ok=True)
+                tmp_path = cache_path.with_name(f"{cache_path.name}.{uuid4().hex}.tmp")
+                f = await aiofiles.open(tmp_path, "wb")
+
+            # 写入磁盘的数据攒够 1 MiB 再写，减少线程池调度次数
+            pending: list[bytes] = []
+            pending_size = 0
+            async for chunk in resp.content.iter_chunked(STREAM_CHUNK_SIZE):
+                if f is not None:
+                    pending.append(chunk)
+                    pending_size += len(chunk)
+                    if pending_size >= CACHE_WRITE_BUFFER_SIZE:
+                        await f.write(b"".join(pending))
+                        pending.clear()
+                        pending_size = 0
+                yield chunk
+
+            if f is not None:
+                if pending:
+                    await f.write(b"".join(pending))
+                await f.close()
+                f = None
+                await aiofiles.os.replace(tmp_path, cache_path)  # type: ignore
+                tmp_path = None
+        finally:
+            # 传输中断时丢弃未写完的临时文件，避免缓存不完整的内容
+            if f is not None:
+                await f.close()
+            if tmp_path is not None:
+                with suppress(OSError):
+                    await aiofiles.os.remove(tmp_path)
+            complete()
+
+    headers = filter_response_headers(resp.headers)
+    headers["X-Accel-Buffering"] = "no"
+    if extra_headers:
+        headers.update(extra_headers)
+
+    # 响应未开始发送时连接即断开的情况下，由 on_close 释放上游连接
+    return ProxyStreamingResponse(iter_content(), status_code=resp.status, headers=headers, on_close=complete)
+
+
+async def read_bytes(path: Path) -> bytes:
+    return await asyncio.to_thread(path.read_bytes)
+
+
+async def download_resource(path: Path) -> bytes | None:
+    return await single_flight(downloading_resources, path, lambda: _download_resource(path))
+
+
+async def _download_resource(path: Path) -> bytes | None:
     system_logger.info(f"正在下载资源文件: {path.name}")
     url = f"{MAIN_SERVER}/webui/resources/{path.name}"
     session = await AnonymousAiohttp.session()
-    event = asyncio.Event()
-    downloading_resources[path] = event
 
+    with Timer() as t:
+        async with session.get(url) as resp:
+            if resp.status != 200:
+                system_logger.error(f"资源文件下载失败: {path.name} (HTTP {resp.status})")
+                return None
+            data = await resp.read()
+            await write_bytes(path, data)
+
+            system_logger.info(f"资源文件下载完成: {path.name} ({t.elapsed:.2f}s)")
+            return data
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    if not (if_none_match := request.headers.get("if-none-match")):
+        return False
+    if if_none_match.strip() == "*":
+        # RFC 9110: * 匹配任意当前表示
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+
+async def file_response(path: Path, media_type: str | None = None) -> FileResponse | None:
+    """
+    仅 stat 一次即返回文件响应，文件不存在时返回 None
+    """
     try:
+        st = await aiofiles.os.stat(path)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+    if not stat.S_ISREG(st.st_mode):
+        return None
+    return FileResponse(path, media_type=media_type, stat_result=st)
+
+
+def content_etag(data: bytes) -> str:
+    return f'"{blake2b(data, digest_size=8).hexdigest()}"'
+
+
+def asset_response(
+    asset: LocalAsset, request: Request, headers: dict[str, str], default_media_type: str | None = None
+) -> Response:
+    if asset.etag is not None:
+        headers = {**headers, "ETag": asset.etag}
+        if etag_matches(request, asset.etag):
+            return Response(status_code=304, headers=headers)
+    return Response(content=asset.data, media_type=asset.media_type or default_media_type, headers=headers)
+
+
+async def cached_file_response(path: Path, request: Request, headers: dict[str, str]) -> Response | None:
+    """
+    返回缓存文件的响应，客户端已有相同版本时返回 304，文件不存在时返回 None
+
+    较小的文件首次命中后保存在内存中，之后无需再访问磁盘
+    """
+    key = str(path)
+    if asset := cached_asset_cache.get(key):
+        return asset_response(asset, request, headers)
+
+    try:
+        st = await aiofiles.os.stat(path)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+    if not stat.S_ISREG(st.st_mode):
+        return None
+
+    etag = f'"{st.st_mtime_ns:x}-{st.st_size:x}"'
+    media_type = guess_media_type(path.name)
+    if st.st_size <= CACHED_ASSET_MEMORY_LIMIT:
+        try:
+            data = await read_bytes(path)
+        except FileNotFoundError:
+            return None
+        asset = LocalAsset(data=data, media_type=media_type, etag=etag)
+        cached_asset_cache.set(key, asset)
+        return asset_response(asset, request, headers)
+
+    headers = {**headers, "ETag": etag}
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    return FileResponse(path, headers=headers, media_type=media_type, stat_result=st)
+
+
+class IndexCache:
+    """
+    index.html 的内存缓存，TTL 内直接使用缓存，过期后仅由一个请求向上游获取
+    """
+
+    TTL = 300
+    content: bytes | None = None
+    headers: dict[str, str] = {}
+    updated_at: float = 0
+    lock = asyncio.Lock()
+
+    @classmethod
+    def fresh(cls) -> bool:
+        return cls.content is not None and time.monotonic() - cls.updated_at < cls.TTL
+
+    @classmethod
+    async def get(cls, request: Request) -> tuple[bytes, int, dict[str, str]]:
+        if not cls.fresh():
+            async with cls.lock:
+                if not cls.fresh() and (failed := await cls.refresh(request)) is not None:
+                    return failed
+
+        return cls.content, 200, dict(cls.headers)  # type: ignore
+
+    @classmethod
+    async def refresh(cls, request: Request) -> tuple[bytes, int, dict[str, str]] | None:
+        """
+        向上游刷新缓存，不转发客户端的条件请求头，保证取得完整内容
+
+        刷新失败时若已有缓存则继续使用旧缓存
+
+        Returns:
+            tuple | None: 无可用缓存且上游未返回 200 时，返回上游的响应，否则为 None
+        """
+        try:
+            content, status_code, headers = await reverse_proxy(f"{WEBUI_BASE}/index.html", request, conditional=False)
+        except HTTPException:
+            if cls.content is None:
+                raise
+            system_logger.warning("刷新 index.html 缓存失败，继续使用旧缓存")
+            return
+
+        if status_code == 200:
+            await cls.update(content, headers)
+        elif cls.content is None:
+            return content, status_code, headers
+        else:
+            system_logger.warning(f"刷新 index.html 缓存失败（状态码 {status_code}），继续使用旧缓存")
+        return None
+
+    @classmethod
+    async def update(cls, content: bytes, headers: dict[str, str]):
+        if content != cls.content:
+            # 内容变化时才写入磁盘缓存
+            await write_bytes(WEBUI_CACHE / "index.html", content)
+
+        # 以内容计算 ETag，替换上游的 ETag
+        headers = {key: value for key, value in headers.items() if key.lower() != "etag"}
+        headers["ETag"] = content_etag(content)
+        cls.content, cls.headers, cls.updated_at = content, headers, time.monotonic()
+
+
+# index.html 中引用的 assets 路径，与 SAFE_RESOURCE_PATH 相同，不接受 . 与 .. 路径段
+ASSET_PATH_SEGMENT = rb"(?!\.\.?(?![\w.\-]))[\w.\-]+"
+ASSET_REFERENCE_PATTERN = re.compile(
+    rb"/assets/(" + ASSET_PATH_SEGMENT + rb"(?:/" + ASSET_PATH_SEGMENT + rb")*)", re.ASCII
+)
+WARMUP_CONCURRENCY = 8
+warmup_task: asyncio.Task | None = None
+
+
+async def prefetch_asset(session: aiohttp.ClientSession, path: str, semaphore: asyncio.Semaphore):
+    # 路径来自上游 index.html，解析后仍需确认位于缓存目录内
+    cache_path = await asyncio.to_thread((WEBUI_CACHE / path).resolve)
+    if not cache_path.is_relative_to(WEBUI_CACHE):
+        system_logger.warning(f"忽略缓存目录外的 WebUI 资源 {path}")
+        return
+    if await aiofiles.os.path.isfile(cache_path):
+        return
+
+    with exception_logger(f"预取 WebUI 资源失败 {path}"):
+        async with semaphore, session.get(f"{WEBUI_BASE}/assets/{path}") as resp:
+            if resp.status == 200:
+                await write_bytes(cache_path, await resp.read())
+
+
+async def warmup_webui_cache():
+    """
+    获取 index.html 并并发预取其引用的 assets，避免首次访问时逐个向上游请求
+    """
+    with exception_logger("预热 WebUI 缓存失败"):
+        session = await AnonymousAiohttp.session()
+        async with session.get(f"{WEBUI_BASE}/index.html") as resp:
+            if resp.status != 200:
+                return
+            content = await resp.read()
+            headers = filter_response_headers(resp.headers)
+
+        await IndexCache.update(content, headers)
+
+        paths = dict.fromkeys(match.decode() for match in ASSET_REFERENCE_PATTERN.findall(content))
+        semaphore = asyncio.Semaphore(WARMUP_CONCURRENCY)
         with Timer() as t:
-            async with session.get(url) as resp:
-                if resp.status != 200:
-                    system_logger.error(f"资源文件下载失败: {path.name} (HTTP {resp.status})")
-                    return None
-                data = await resp.read()
+            async with asyncio.TaskGroup() as tg:
+                for path in paths:
+                    tg.create_task(prefetch_asset(session, path, semaphore))
+        system_logger.debug(f"WebUI 缓存预热完成: {len(paths)} 个资源 ({t.elapsed:.2f}s)")
 
-                path.parent.mkdir(parents=True, exist_ok=True)
 
-                async with aiofiles.open(path, "wb") as f:
-                    await f.write(data)
+def start_webui_warmup(_=None):
+    global warmup_task
+    if LOCAL_OVERRIDE_ENABLED or (warmup_task is not None and not warmup_task.done()):
+        return
+    warmup_task = asyncio.create_task(warmup_webui_cache())
+
+
+async def stop_webui_warmup(_=None):
+    global warmup_task
+    if warmup_task is None:
+        return
+    task, warmup_task = warmup_task, None
+    if not task.done():
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
 
-                system_logger.info(f"资源文件下载完成: {path.name} ({t.elapsed:.2f}s)")
-                return data
-    finally:
-        event.set()
-        downloading_resources.pop(path, None)
+
+INITIALIZE_REDIRECT = b'<script>location.href="/#/initialize"</script></head>'
+# index.html 内容 -> 插入初始化跳转后的内容，bytes 的哈希值会被缓存，命中时无需重新扫描
+initialize_index_variants: OrderedDict[bytes, bytes] = OrderedDict()
+
+
+def with_initialize_redirect(content: bytes) -> bytes:
+    if (patched := initialize_index_variants.get(content)) is None:
+        patched = content.replace(b"</head>", INITIALIZE_REDIRECT)
+        initialize_index_variants[content] = patched
+        if len(initialize_index_variants) > 4:
+            initialize_index_variants.popitem(last=False)
+    return patched
 
 
 @app.get("/", tags=["webui"])
@@ -207,32 +726,29 @@ async def index(request: Request):
     if LOCAL_OVERRIDE_ENABLED:
         local_asset = await load_local_asset("index.html")
         if local_asset:
-            content = local_asset.data
-            headers = {}
-
+            media_type = local_asset.media_type or "text/html"
             if Server.need_initialize():
-                content = content.replace(b"</head>", b'<script>location.href="/#/initialize"</script></head>')
-                headers["Cache-Control"] = "no-store"
+                content = with_initialize_redirect(local_asset.data)
+                return Response(content=content, media_type=media_type, headers={"Cache-Control": "no-store"})
 
-            return Response(content=content, media_type=local_asset.media_type or "text/html", headers=headers)
+            return asset_response(local_asset, request, {}, media_type)
 
     try:
-        content, status_code, headers = await reverse_proxy(f"{WEBUI_BASE}/index.html", request)
-        if status_code == 200:
-            # 缓存成功的请求
-            async with aiofiles.open(cache_path, "wb") as f:
-                await f.write(content)
-
+        content, status_code, headers = await IndexCache.get(request)
     except Exception:
-        if not cache_path.exists():
+        if not (response := await file_response(cache_path, media_type="text/html")):
             return Response(status_code=503, content="Service Unavailable")
 
         system_logger.warning("无法连接到 WebUI 服务器，使用缓存的文件")
-        return FileResponse(cache_path)
+        return response
 
     if Server.need_initialize():
-        content = content.replace(b"</head>", b'<script>location.href="/#/initialize"</script></head>')
+        # 插入跳转后的内容与 ETag 不对应，且不应被缓存
+        content = with_initialize_redirect(content)
+        headers.pop("ETag", None)
         headers["Cache-Control"] = "no-store"
+    elif status_code == 200 and etag_matches(request, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
 
     return Response(content=content, status_code=status_code, headers=headers)
 
@@ -244,22 +760,33 @@ async def assets(path: str, request: Request):
     if LOCAL_OVERRIDE_ENABLED:
         local_asset = await load_local_asset(f"assets/{path}")
         if local_asset:
-            media_type = local_asset.media_type or "application/octet-stream"
-            return Response(content=local_asset.data, media_type=media_type, headers=cache_headers)
+            return asset_response(local_asset, request, cache_headers, "application/octet-stream")
 
     # assets下的文件不会更新，所以优先使用本地缓存
     cache_path = WEBUI_CACHE / path
-    if cache_path.exists():
-        return FileResponse(cache_path, headers=cache_headers)
+    if response := await cached_file_response(cache_path, request, cache_headers):
+        return response
 
-    content, status_code, headers = await reverse_proxy(f"{WEBUI_BASE}/assets/{path}", request)
-    headers.update(cache_headers)
-    if status_code == 200:
-        cache_path.parent.mkdir(parents=True, exist_ok=True)
-        async with aiofiles.open(cache_path, "wb") as f:
-            await f.write(content)
+    url = f"{WEBUI_BASE}/assets/{path}"
+    if (caching := caching_assets.get(cache_path)) is not None:
+        # 等待同一资源的首个请求写入缓存，失败或超时时再自行转发
+        with suppress(TimeoutError):
+            await asyncio.wait_for(caching.wait(), CACHING_ASSET_WAIT_TIMEOUT)
+            if response := await cached_file_response(cache_path, request, cache_headers):
+                return response
+        return await stream_proxy(url, request, cache_headers)
 
-    return Response(content=content, status_code=status_code, headers=headers)
+    event = caching_assets[cache_path] = asyncio.Event()
+
+    def finish():
+        event.set()
+        caching_assets.pop(cache_path, None)
+
+    try:
+        return await stream_proxy(url, request, cache_headers, cache_path, finish)
+    except BaseException:
+        finish()
+        raise
 
 
 @app.get("/favicon.ico", tags=["webui"])
@@ -267,11 +794,9 @@ async def favicon(request: Request):
     if LOCAL_OVERRIDE_ENABLED:
         local_asset = await load_local_asset("favicon.ico")
         if local_asset:
-            media_type = local_asset.media_type or "image/x-icon"
-            return Response(content=local_asset.data, media_type=media_type)
+            return asset_response(local_asset, request, {}, "image/x-icon")
 
-    content, status_code, headers = await reverse_proxy(f"{WEBUI_BASE}/favicon.ico", request)
-    return Response(content=content, status_code=status_code, headers=headers)
+    return await stream_proxy(f"{WEBUI_BASE}/favicon.ico", request)
 
 
 class ServerInfo(BaseModel):
@@ -279,31 +804,41 @@ class ServerInfo(BaseModel):
     need_initialize: bool
 
 
-@app.get("/api/info", tags=["webui"])
-async def webui_info() -> ServerInfo:
-    return ServerInfo(version=PROGRAM_VERSION, need_initialize=Server.need_initialize())
+# 响应内容只取决于是否需要初始化，预先序列化两种结果
+SERVER_INFO_JSON = {
+    need_initialize: ServerInfo(version=PROGRAM_VERSION, need_initialize=need_initialize).model_dump_json().encode()
+    for need_initialize in (True, False)
+}
+
+
+@app.get("/api/info", tags=["webui"], response_model=ServerInfo)
+async def webui_info():
+    return Response(content=SERVER_INFO_JSON[Server.need_initialize()], media_type="application/json")
 
 
 @app.get("/resources/{path:path}", tags=["webui"])
 async def resources(path: str, request: Request):
-    if path not in VALID_RESOURCES and not DEV:
+    if path in VALID_RESOURCES:
+        # 白名单中均为固定的文件名，无需解析即可确认位于资源目录内
+        file_path = VALID_RESOURCE_PATHS[path]
+    elif not DEV:
         return Response(status_code=403, content="Forbidden")
+    else:
+        if not SAFE_RESOURCE_PATH.fullmatch(path):
+            return Response(status_code=400, content="Bad Request")
 
-    if ".." in path or path.startswith("/") or Path(path).is_absolute():
-        return Response(status_code=400, content="Bad Request")
-
-    file_path = (RESOURCE_DIR / path).resolve()
+        file_path = await asyncio.to_thread((RESOURCE_ROOT / path).resolve)
 
-    if not file_path.is_relative_to(RESOURCE_DIR.resolve()):
-        return Response(status_code=400, content="Bad Request")
+        if not file_path.is_relative_to(RESOURCE_ROOT):
+            return Response(status_code=400, content="Bad Request")
 
-    if not file_path.exists() or not file_path.is_file():
-        if path in DOWNLOADABLE_RESOURCES:
-            data = await download_resource(file_path)
-            if data is None:
-                return Response(status_code=404, content="Not Found")
-            return Response(content=data, media_type="application/octet-stream")
+    if response := await file_response(file_path):
+        return response
 
-        return Response(status_code=404, content="Not Found")
+    if path in DOWNLOADABLE_RESOURCES:
+        data = await download_resource(file_path)
+        if data is None:
+            return Response(status_code=404, content="Not Found")
+        return Response(content=data, media_type="application/octet-stream")
 
-    return FileResponse(file_path)
+    return Response(status_code=404, content="Not Found")
@@ -1,9 +1,10 @@
 import asyncio
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 
 import uvicorn
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 
@@ -48,15 +49,43 @@ async def lifespan(app: FastAPI):
     # if DEV:
     config = initialize_server_config() if Server.need_system() else Controller.config.server
     Server.display_startup_messages(config)
+    # 不阻塞启动流程，地址获取完成后再输出
+    display_urls_task = asyncio.create_task(asyncio.to_thread(Server.display_listenable_urls, config))
 
     await Controller.start()
 
     yield
-    await Controller.stop()
-    Server._secure_key = None
+    try:
+        # 关闭时无需等待地址输出完成
+        display_urls_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await display_urls_task
+    finally:
+        await Controller.stop()
+        Server._secure_key = None
 
 
 app = FastAPI(lifespan=lifespan)
+# 压缩 WebUI 的 HTML/JS/CSS 与 JSON 响应，已压缩的图片、字体、压缩包与 SSE 不压缩
+# exclude_content_types 需要 starlette>=1.7.0
+GZIP_EXCLUDED_CONTENT_TYPES = (
+    "application/gzip",
+    "application/x-gzip",
+    "application/zip",
+    "audio/*",
+    "font/woff",
+    "font/woff2",
+    "image/avif",
+    "image/gif",
+    "image/jpeg",
+    "image/png",
+    "image/webp",
+    "text/event-stream",
+    "video/*",
+)
+app.add_middleware(
+    GZipMiddleware, minimum_size=1024, compresslevel=6, exclude_content_types=GZIP_EXCLUDED_CONTENT_TYPES
+)
 app.add_middleware(TrustedForwardMiddleware)
 app.add_middleware(
     CORSMiddleware,
@@ -91,6 +120,7 @@ class Server:
     need_restart: bool = False
     server: uvicorn.Server | None = None
     _secure_key: str | None = None
+    _initialized: bool = False
 
     @classmethod
     def secure_key(cls):
@@ -114,7 +144,17 @@ class Server:
 
     @classmethod
     def need_initialize(cls):
-        return cls.need_system() or cls.need_user()
+        # 初始化完成后结果保持不变，直到用户变更时重新检查
+        if cls._initialized:
+            return False
+        if need := cls.need_system() or cls.need_user():
+            return need
+        cls._initialized = True
+        return False
+
+    @classmethod
+    def invalidate_initialize_state(cls, _=None):
+        cls._initialized = False
 
     @classmethod
     def display_startup_messages(cls, config: ServerConfig):
@@ -133,6 +173,9 @@ class Server:
                 # TODO 公网运行模式下，添加一定时间不初始化则自动关闭服务的功能
                 system_logger.warning("正在以公网模式运行，请尽快完成初始化！")
 
+    @classmethod
+    def display_listenable_urls(cls, config: ServerConfig):
+        # 监听 0.0.0.0 时需解析主机名获取网卡地址，可能较慢，应在线程中调用
         listenable_urls = config.listenable_urls
         log_fn = system_logger.warning if DEV else system_logger.info
         if len(listenable_urls) == 1:
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 import ast
+from functools import lru_cache
 from pathlib import Path
-from typing import Literal
+from typing import TYPE_CHECKING, Any, Literal
 from urllib.parse import quote_plus
 
 from pydantic import AliasChoices, BaseModel, Field, computed_field, field_validator
@@ -12,6 +13,9 @@ from src.utils.tools import Mosaic, get_listenable_addresses, int_time, random_s
 
 from .constants import BASE_DIR, CONFIRM_EXPIRE, CONTENT_VALID_EXPIRE, COOKIE_MIN_MOSAIC_LENGTH
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
 
 class ScanConfig(BaseModel, extra="ignore"):
     loop_cd: int = 10
@@ -34,38 +38,50 @@ class DatabaseConfig(BaseModel, extra="ignore"):
     @computed_field
     @property
     def database_url(self) -> str:
-        if self.type == "sqlite":
-            if not self.path:
-                raise ValueError("SQLite database path is required")
-            url_path = Path(self.path).resolve().as_posix()
-            return f"sqlite+aiosqlite:///{url_path}"
-        if not all([self.username, self.password, self.host, self.port, self.db]):
-            raise ValueError("Database configuration is incomplete")
-        if self.type == "postgresql":
-            return (
-                f"postgresql+asyncpg://"
-                f"{quote_plus(self.username)}:{quote_plus(self.password)}"  # type: ignore
-                f"@{self.host}:{self.port}/{self.db}"
-            )
-        else:
-            raise ValueError("Unsupported database type")
+        return build_database_url(self.type, self.path, self.username, self.password, self.host, self.port, self.db)
 
     @property
     def mosaic(self):
-        config = self.model_copy()
-        if config.password:
-            config.password = Mosaic.full(config.password)
-        return config
+        if not self.password:
+            return self.model_copy()
+        return self.model_copy(update={"password": Mosaic.full(self.password)})
 
     def apply_new(self, new_config: DatabaseConfig):
-        new_config = new_config.model_copy(deep=True)
-        mosaic_config = self.mosaic
-
-        if new_config.password != self.password:
-            if new_config.password == mosaic_config.password:
-                new_config.password = self.password
-
-        return new_config
+        # 仅在密码变化时计算打码值，与打码值相同视为未修改；字段均为不可变类型，浅拷贝即可
+        password = new_config.password
+        if password != self.password and self.password and password == Mosaic.full(self.password):
+            return new_config.model_copy(update={"password": self.password})
+        return new_config.model_copy()
+
+
+@lru_cache(maxsize=8)
+def build_database_url(
+    type: str,  # noqa: A002
+    path: str | None,
+    username: str | None,
+    password: str | None,
+    host: str | None,
+    port: int | None,
+    db: str | None,
+) -> str:
+    """
+    根据数据库配置生成连接 URL，结果按配置缓存，避免每次访问都解析路径与转义
+    """
+    if type == "sqlite":
+        if not path:
+            raise ValueError("SQLite database path is required")
+        url_path = Path(path).resolve().as_posix()
+        return f"sqlite+aiosqlite:///{url_path}"
+    if not all([username, password, host, port, db]):
+        raise ValueError("Database configuration is incomplete")
+    if type == "postgresql":
+        return (
+            f"postgresql+asyncpg://"
+            f"{quote_plus(username)}:{quote_plus(password)}"  # type: ignore
+            f"@{host}:{port}/{db}"
+        )
+    else:
+        raise ValueError("Unsupported database type")
 
 
 class ProcessConfig(BaseModel):
@@ -92,10 +108,12 @@ class ForumConfig(BaseModel):
 
     @property
     def mosaic(self):
-        config = self.model_copy()
-        config.bduss = Mosaic.compress(config.bduss, 4, 2, min_length=COOKIE_MIN_MOSAIC_LENGTH, ratio=8)
-        config.stoken = Mosaic.compress(config.stoken, 4, 2, min_length=COOKIE_MIN_MOSAIC_LENGTH, ratio=4)
-        return config
+        return self.model_copy(
+            update={
+                "bduss": Mosaic.compress(self.bduss, 4, 2, min_length=COOKIE_MIN_MOSAIC_LENGTH, ratio=8),
+                "stoken": Mosaic.compress(self.stoken, 4, 2, min_length=COOKIE_MIN_MOSAIC_LENGTH, ratio=4),
+            }
+        )
 
 
 STR_OPERATION = Literal["ignore", "delete", "block", "delete_and_block"]
@@ -115,38 +133,15 @@ class RuleLogic(BaseModel):
 
     advanced: bool = False
     expression: str
-    _tree: ast.Expression | None = None
 
     @field_validator("expression")
     @classmethod
     def validate_expression(cls, v):
         try:
-            # mode='eval' 确保它是一个表达式，而不是语句
-            tree = ast.parse(v, mode="eval")
+            # 校验结果与编译结果共用缓存，相同表达式在进程内只解析一次
+            compile_logic_expression(v)
         except SyntaxError as e:
             raise ValueError(f"表达式语法错误: {e}")  # noqa: B904
-
-        # 允许的节点类型白名单
-        allowed_nodes = (
-            ast.Expression,
-            ast.BoolOp,  # and, or
-            ast.UnaryOp,  # not
-            ast.And,
-            ast.Or,
-            ast.Not,
-            ast.Constant,
-        )
-
-        for node in ast.walk(tree):
-            if not isinstance(node, allowed_nodes):
-                raise ValueError(f"表达式包含非法元素: {type(node).__name__}")
-
-            # 额外检查：确保常量只能是整数（条件编号）
-            if isinstance(node, ast.Constant):
-                val = node.value
-                if not isinstance(val, int):
-                    raise ValueError(f"表达式只能包含整数作为条件编号，发现: {val}")
-
         return v
 
     @computed_field
@@ -157,81 +152,106 @@ class RuleLogic(BaseModel):
         第一层：必须为 True 的条件（如果这些条件为 False，整个表达式必为 False）
         第二层：其他条件
         """
-        if self._tree is None:
-            try:
-                self._tree = ast.parse(self.expression, mode="eval")
-            except SyntaxError:
-                return [[], []]
-
-        def _get_necessary(node) -> set[int]:
-            if isinstance(node, ast.Expression):
-                return _get_necessary(node.body)
-            elif isinstance(node, ast.BoolOp):
-                if isinstance(node.op, ast.And):
-                    s = set()
-                    for val in node.values:
-                        s.update(_get_necessary(val))
-                    return s
-                elif isinstance(node.op, ast.Or):
-                    sets = [_get_necessary(val) for val in node.values]
-                    if not sets:
-                        return set()
-                    return set.intersection(*sets)
-            elif isinstance(node, ast.Constant):
-                if isinstance(node.value, int):
-                    return {node.value}
-            return set()
-
-        necessary = _get_necessary(self._tree)
-
-        all_indices = set()
-        for node in ast.walk(self._tree):
-            if isinstance(node, ast.Constant) and isinstance(node.value, int):
-                all_indices.add(node.value)
-
-        optional = all_indices - necessary
-        return [sorted(necessary), sorted(optional)]
+        try:
+            _, necessary, optional = compile_logic_expression(self.expression)
+        except SyntaxError:
+            return [[], []]
+        return [list(necessary), list(optional)]
 
     def evaluate_expression(self, results: dict[int, bool]) -> bool:
         """
         安全地评估逻辑表达式。
 
-        :param results: 条件编号到布尔值的映射，如 {0: True, 1: False, 2: True}
+        :param results: 条件编号到布尔值的映射，如 {0: True, 1: False, 2: True}，缺失的条件视为 False
         """
-        if self._tree is None:
-            self._tree = ast.parse(self.expression, mode="eval")
+        return compile_logic_expression(self.expression)[0](results)
 
-        def _eval(node):
-            # 递归求值
-            if isinstance(node, ast.Expression):
-                return _eval(node.body)
 
-            elif isinstance(node, ast.BoolOp):
-                if isinstance(node.op, ast.And):
-                    return all(_eval(val) for val in node.values)
-                elif isinstance(node.op, ast.Or):
-                    return any(_eval(val) for val in node.values)
+def analyze_logic_tree(node: ast.AST) -> tuple[set[int], set[int]]:
+    """
+    单次递归遍历校验表达式节点，同时收集条件编号
 
-            elif isinstance(node, ast.UnaryOp):
-                if isinstance(node.op, ast.Not):
-                    return not _eval(node.operand)
+    仅允许 and / or / not 与整数常量（条件编号）
 
-            elif isinstance(node, ast.Constant):
-                # 获取条件编号
-                idx = node.value
-                # 从结果集中查找对应的值
-                if idx not in results:
-                    # 这里可以决定是报错还是默认为 False
-                    return False
+    Returns:
+        tuple: (必须为 True 的条件编号, 出现的全部条件编号)
 
-                if isinstance(idx, int):
-                    return results[idx]
-                else:
-                    raise ValueError(f"条件编号必须是整数，发现: {idx}")
+    Raises:
+        ValueError: 包含非法元素或非整数常量
+    """
+    node_type = type(node)
+    if node_type is ast.Expression:
+        return analyze_logic_tree(node.body)  # type: ignore[attr-defined]
+    elif node_type is ast.BoolOp:
+        results = [analyze_logic_tree(val) for val in node.values]  # type: ignore[attr-defined]
+        all_indices = set().union(*(indices for _, indices in results))
+        if type(node.op) is ast.And:  # type: ignore[attr-defined]
+            # and：任一子表达式必须为 True 的条件都必须为 True
+            return set().union(*(necessary for necessary, _ in results)), all_indices
+        # or：仅所有分支共同必须为 True 的条件才必须为 True
+        return set.intersection(*(necessary for necessary, _ in results)), all_indices
+    elif node_type is ast.UnaryOp:
+        op_type = type(node.op)  # type: ignore[attr-defined]
+        if op_type is not ast.Not:
+            raise ValueError(f"表达式包含非法元素: {op_type.__name__}")
+        # not 子表达式不贡献必须为 True 的条件
+        return set(), analyze_logic_tree(node.operand)[1]  # type: ignore[attr-defined]
+    elif node_type is ast.Constant:
+        # 额外检查：确保常量只能是整数（条件编号）
+        val = node.value  # type: ignore[attr-defined]
+        if not isinstance(val, int):
+            raise ValueError(f"表达式只能包含整数作为条件编号，发现: {val}")
+        return {val}, {val}
+    raise ValueError(f"表达式包含非法元素: {node_type.__name__}")
+
+
+class _LogicCompiler(ast.NodeTransformer):
+    """
+    将条件编号 N 替换为 r.get(N, False)
+    """
+
+    def visit_Constant(self, node: ast.Constant) -> ast.expr:
+        return ast.Call(
+            func=ast.Attribute(value=ast.Name(id="r", ctx=ast.Load()), attr="get", ctx=ast.Load()),
+            args=[ast.Constant(value=node.value), ast.Constant(value=False)],
+            keywords=[],
+        )
 
-            raise ValueError(f"不支持的节点: {type(node)}")
 
-        return _eval(self._tree)
+@lru_cache(maxsize=1024)
+def compile_logic_expression(
+    expression: str,
+) -> tuple[Callable[[dict[int, bool]], bool], tuple[int, ...], tuple[int, ...]]:
+    """
+    校验逻辑表达式并编译为函数，同一表达式只解析、编译一次
+
+    Returns:
+        tuple: (求值函数, 必须为 True 的条件编号, 其他条件编号)
+
+    Raises:
+        SyntaxError: 表达式语法错误
+        ValueError: 包含非法元素或非整数常量
+    """
+    # mode='eval' 确保它是一个表达式，而不是语句
+    tree = ast.parse(expression, mode="eval")
+    necessary, all_indices = analyze_logic_tree(tree)
+    optional = all_indices - necessary
+
+    body = _LogicCompiler().visit(tree.body)
+    if necessary and isinstance(tree.body, ast.BoolOp) and isinstance(tree.body.op, ast.Or):
+        # 各分支共同必须为 True 的条件提前检查，任一为 False 时直接短路，无需逐个分支求值
+        checks = [_LogicCompiler().visit(ast.Constant(value=i)) for i in sorted(necessary)]
+        body = ast.BoolOp(op=ast.And(), values=[*checks, body])
+
+    lambda_tree = ast.Expression(
+        body=ast.Lambda(
+            args=ast.arguments(posonlyargs=[], args=[ast.arg(arg="r")], kwonlyargs=[], kw_defaults=[], defaults=[]),
+            body=body,
+        )
+    )
+    ast.fix_missing_locations(lambda_tree)
+    fn = eval(compile(lambda_tree, "<logic>", "eval"), {"__builtins__": {}})  # noqa: S307
+    return fn, tuple(sorted(necessary)), tuple(sorted(optional))
 
 
 class RuleConfig(BaseModel):
@@ -267,7 +287,7 @@ class ServerConfig(BaseModel, extra="ignore"):
     access_log: bool = False
     token_expire_days: int = 7
     key_last_update: int = Field(default_factory=int_time)
-    encryption_method: Literal["plain", "md5"] = "plain"
+    encryption_method: Literal["plain", "md5", "blake2b"] = "plain"
     encryption_salt: str = Field(default_factory=random_secret)
 
     @field_validator("key")
@@ -297,39 +317,47 @@ class ServerConfig(BaseModel, extra="ignore"):
             "access_log": self.access_log,
         }
 
+    @staticmethod
+    def _mosaic_key(key: str) -> str:
+        return Mosaic.full(key)
+
+    @staticmethod
+    def _mosaic_secret(secret: str) -> str:
+        return Mosaic.compress(secret, 2, 0, ratio=8)
+
     @property
     def mosaic(self):
-        config = self.model_copy()
-        config.key = Mosaic.full(config.key)
-        config.secret_key = Mosaic.compress(config.secret_key, 2, 0, ratio=8)
-        config.encryption_salt = Mosaic.compress(config.encryption_salt, 2, 0, ratio=8)
-        return config
+        return self.model_copy(
+            update={
+                "key": self._mosaic_key(self.key),
+                "secret_key": self._mosaic_secret(self.secret_key),
+                "encryption_salt": self._mosaic_secret(self.encryption_salt),
+            }
+        )
 
     def apply_new(self, new_config: ServerConfig):
-        new_config = new_config.model_copy(deep=True)
-        mosaic_config = self.mosaic
-
+        # 直接计算需要比较的打码字段，并将所有覆盖项合并到一次浅拷贝中
         # 禁止覆盖 key_last_update
-        new_config.key_last_update = self.key_last_update
+        update: dict[str, Any] = {"key_last_update": self.key_last_update}
 
         if new_config.key != self.key:
-            if new_config.key == mosaic_config.key:
-                new_config.key = self.key
+            if new_config.key == self._mosaic_key(self.key):
+                update["key"] = self.key
             else:
-                new_config.key_last_update = int_time()
+                update["key_last_update"] = int_time()
 
+        secret_key = new_config.secret_key
         if new_config.token_expire_days != self.token_expire_days:
-            new_config.secret_key = random_secret()
+            secret_key = update["secret_key"] = random_secret()
 
-        if new_config.secret_key != self.secret_key:
-            if new_config.secret_key == mosaic_config.secret_key:
-                new_config.secret_key = self.secret_key
+        if secret_key != self.secret_key and secret_key == self._mosaic_secret(self.secret_key):
+            update["secret_key"] = self.secret_key
 
-        if new_config.encryption_salt != self.encryption_salt:
-            if new_config.encryption_salt == mosaic_config.encryption_salt:
-                new_config.encryption_salt = self.encryption_salt
+        encryption_salt = new_config.encryption_salt
+        if encryption_salt != self.encryption_salt and encryption_salt == self._mosaic_secret(self.encryption_salt):
+            update["encryption_salt"] = self.encryption_salt
 
-        return new_config
+        return new_config.model_copy(update=update)
 
 
 class SystemConfig(BaseModel, extra="ignore"):
@@ -342,13 +370,13 @@ class SystemConfig(BaseModel, extra="ignore"):
 
     @property
     def mosaic(self):
-        config = self.model_copy(deep=True)
-        config.server = config.server.mosaic
-        config.database = config.database.mosaic
-        return config
+        # 仅替换需要打码的子配置，其余子配置共享引用
+        return self.model_copy(update={"server": self.server.mosaic, "database": self.database.mosaic})
 
     def apply_new(self, new_config: SystemConfig):
-        new_config = new_config.model_copy(deep=True)
-        new_config.server = self.server.apply_new(new_config.server)
-        new_config.database = self.database.apply_new(new_config.database)
-        return new_config
+        return new_config.model_copy(
+            update={
+                "server": self.server.apply_new(new_config.server),
+                "database": self.database.apply_new(new_config.database),
+            }
+        )
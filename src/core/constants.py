@@ -50,6 +50,9 @@ LOG_DIR = BASE_DIR / "logs"
 SYSTEM_CONFIG_PATH = BASE_DIR / "config.toml"
 
 
-for directory in [LOG_DIR, USER_DIR, CACHE_DIR]:
-    if not directory.exists():
-        directory.mkdir(parents=True)
+def ensure_dirs():
+    """
+    创建运行所需的数据目录，由 Controller.initialize 调用，避免在导入时产生文件系统操作
+    """
+    for directory in (LOG_DIR, USER_DIR, CACHE_DIR):
+        directory.mkdir(parents=True, exist_ok=True)
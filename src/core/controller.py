@@ -1,17 +1,13 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
-
 from src.schemas.event import UpdateEventData
 from src.schemas.process import ProcessObject
 from src.utils.config import read_config, write_config
 from src.utils.event import AsyncEvent
 from src.utils.logging import system_logger
 
-from .constants import SYSTEM_CONFIG_PATH
-
-if TYPE_CHECKING:
-    from .config import SystemConfig  # noqa: TC004
+from .config import SystemConfig
+from .constants import SYSTEM_CONFIG_PATH, ensure_dirs
 
 
 class Controller:
@@ -26,17 +22,13 @@ class Controller:
 
     @classmethod
     def initialize(cls) -> bool:
-        if cls.initialized:
-            return False
-
         """
         在所有包导入后调用，预加载配置
         """
-        try:
-            from .config import SystemConfig  # noqa: TC001
-        except Exception:
-            system_logger.exception("导入 SystemConfig 失败，可能是循环导入导致")
-            raise
+        if cls.initialized:
+            return False
+
+        ensure_dirs()
 
         if not getattr(cls, "config", None):
             cls.config = read_config(SYSTEM_CONFIG_PATH, SystemConfig)
@@ -10,21 +10,29 @@ from .plugin import load_plugins
 
 def initialize():
     if Controller.initialize():
+        from src.api.encryt import update_encryptor
         from src.api.routes.resource import ResourceAPIExecutorManager
+        from src.api.routes.webui import WebUIZip, start_webui_warmup, stop_webui_warmup
+        from src.api.server import Server
 
         Controller.Start.on(UserManager.load_users)
         Controller.Start.on(Database.startup)
         Controller.Start.on(CacheCleaner.start)
+        Controller.Start.on(start_webui_warmup)
         Controller.SystemConfigChange.on(Crawler.restart)
         Controller.SystemConfigChange.on(Database.update_config)
         Controller.SystemConfigChange.on(CacheCleaner.update_clear_cache_time)
+        Controller.SystemConfigChange.on(update_encryptor)
         Controller.Stop.on(UserManager.clear_users)
         Controller.Stop.on(Database.teardown)
         Controller.Stop.on(Crawler.start_or_stop)
         Controller.Stop.on(CacheCleaner.stop)
         Controller.Stop.on(stop_anonymous_clients)
         UserManager.UserChange.on(Crawler.update_needs)
+        UserManager.UserChange.on(Server.invalidate_initialize_state)
         UserManager.UserConfigChange.on(Crawler.update_needs)
         Controller.Stop.on(ResourceAPIExecutorManager.shutdown_executor)
+        Controller.Stop.on(WebUIZip.close)
+        Controller.Stop.on(stop_webui_warmup)
 
         load_plugins()
@@ -1,24 +1,65 @@
 from __future__ import annotations
 
 import importlib.util
-import re
+import os
 import shutil
 import sys
 import uuid
 import zipfile
-from typing import TYPE_CHECKING
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
 
 from src.core.constants import CACHE_DIR, PLUGIN_DIR
 from src.utils.logging import exception_logger, system_logger
 
-if TYPE_CHECKING:
-    from pathlib import Path
-
-
 PLUGIN_CACHE_UUID = str(uuid.uuid4())
 
 BASE_PLUGIN_CACHE_DIR: Path = CACHE_DIR / "plugins"
 PLUGIN_CACHE_DIR = BASE_PLUGIN_CACHE_DIR / PLUGIN_CACHE_UUID
+LIB_ZIP_PREFIX = "lib["
+LIB_ZIP_SUFFIX = "].zip"
+EXTRACT_BUFFER_SIZE = 1 << 20
+EXTRACT_MAX_WORKERS = 8
+
+
+def _extract_zip(zf: zipfile.ZipFile, dest: Path) -> None:
+    """
+    逐个成员流式解压 zip 到 dest，替代 extractall
+
+    - 使用较大的缓冲区复制数据，减少读写次数
+    - 跳过 __MACOSX 元数据目录
+    - 拒绝绝对路径与包含 .. 的成员，已创建的目录只创建一次
+    """
+    created_dirs: set[Path] = set()
+
+    def ensure_dir(path: Path):
+        if path not in created_dirs:
+            path.mkdir(parents=True, exist_ok=True)
+            created_dirs.add(path)
+
+    ensure_dir(dest)
+    for info in zf.infolist():
+        name = info.filename.replace("\\", "/")
+        parts = [part for part in name.split("/") if part and part != "."]
+        if not parts or parts[0] == "__MACOSX":
+            continue
+        if name.startswith("/") or ".." in parts or ":" in parts[0]:
+            system_logger.warning(f"跳过不安全的 zip 成员: {info.filename}")
+            continue
+
+        target = dest.joinpath(*parts)
+        if info.is_dir():
+            ensure_dir(target)
+            continue
+
+        ensure_dir(target.parent)
+        with zf.open(info) as src, target.open("wb") as dst:
+            shutil.copyfileobj(src, dst, EXTRACT_BUFFER_SIZE)
+
+
+def _extract_zip_file(zip_path: Path, dest: Path) -> None:
+    with zipfile.ZipFile(zip_path, "r") as zf:
+        _extract_zip(zf, dest)
 
 
 def load_plugins() -> None:
@@ -33,20 +74,25 @@ def load_plugins() -> None:
         system_logger.error(f"插件目录不是一个有效的目录: {PLUGIN_DIR}")
         return
 
+    # 使用 os.scandir 遍历目录，文件类型由目录项直接给出，避免逐项 stat
+    with os.scandir(PLUGIN_DIR) as it:
+        plugin_entries = list(it)
+
     # 当插件目录为空时，跳过加载
-    if not any(PLUGIN_DIR.iterdir()):
+    if not plugin_entries:
         return
 
     # 准备缓存目录以解压插件
     BASE_PLUGIN_CACHE_DIR.mkdir(parents=True, exist_ok=True)
 
     # 尝试清理旧的缓存目录
-    for item in BASE_PLUGIN_CACHE_DIR.iterdir():
-        if item.is_dir():
-            try:
-                shutil.rmtree(item, ignore_errors=True)
-            except Exception:
-                system_logger.warning(f"无法删除旧的插件缓存目录: {item}")
+    with os.scandir(BASE_PLUGIN_CACHE_DIR) as it:
+        for entry in it:
+            if entry.is_dir():
+                try:
+                    shutil.rmtree(entry.path, ignore_errors=True)
+                except Exception:
+                    system_logger.warning(f"无法删除旧的插件缓存目录: {entry.path}")
 
     # 使用唯一子目录避免删除整个目录带来的安全风险
     PLUGIN_CACHE_DIR.mkdir(parents=True, exist_ok=True)
@@ -54,34 +100,49 @@ def load_plugins() -> None:
     system_logger.info("正在加载插件...")
     system_logger.debug(f"扫描插件目录: {PLUGIN_DIR}")
     system_logger.debug(f"插件缓存目录: {PLUGIN_CACHE_DIR}")
-    for item in PLUGIN_DIR.iterdir():
-        if item.name.startswith(("_", ".")):
+
+    # 解压主要为 zlib 与磁盘 IO，会释放 GIL，先并行解压所有 zip 插件，再依次加载
+    zip_entries = [
+        entry
+        for entry in plugin_entries
+        if entry.name.endswith(".zip") and not entry.name.startswith(("_", ".")) and entry.is_file()
+    ]
+    extract_futures: dict[str, Future[None]] = {}
+    if zip_entries:
+        with ThreadPoolExecutor(max_workers=min(EXTRACT_MAX_WORKERS, len(zip_entries))) as executor:
+            for entry in zip_entries:
+                extract_path = PLUGIN_CACHE_DIR / f"webtm_plugin_{Path(entry.name).stem}"
+                extract_futures[entry.path] = executor.submit(_extract_zip_file, Path(entry.path), extract_path)
+
+    for entry in plugin_entries:
+        if entry.name.startswith(("_", ".")):
             continue
 
-        plugin_name = item.stem
-        module_name = f"webtm_plugin_{item.stem}"
+        item = Path(entry.path)
+        plugin_name, suffix = item.stem, item.suffix
+        module_name = f"webtm_plugin_{plugin_name}"
         entry_point: Path | None = None
 
-        with exception_logger(f"加载插件 {item.name} 失败"):
-            if item.is_file() and item.suffix == ".py":
+        with exception_logger(f"加载插件 {entry.name} 失败"):
+            is_file = entry.is_file()
+            if is_file and suffix == ".py":
                 # 情况 1: .py 文件
                 entry_point = item
 
-            elif item.is_dir():
+            elif entry.is_dir():
                 # 情况 2: 目录中包含 plugin.py
                 potential_entry = item / "plugin.py"
                 if potential_entry.exists():
                     entry_point = potential_entry
 
-            elif item.is_file() and item.suffix == ".zip":
+            elif is_file and suffix == ".zip":
                 # 情况 3: Zip 文件
                 extract_path = PLUGIN_CACHE_DIR / module_name
 
                 try:
-                    with zipfile.ZipFile(item, "r") as zf:
-                        zf.extractall(extract_path)
+                    extract_futures[entry.path].result()
                 except zipfile.BadZipFile:
-                    system_logger.error(f"无效的 zip 文件: {item.name}")
+                    system_logger.error(f"无效的 zip 文件: {entry.name}")
                     continue
 
                 # 检查解压路径根目录下是否有 plugin.py
@@ -91,10 +152,17 @@ def load_plugins() -> None:
                 else:
                     # 检查是否有单个文件夹包含 plugin.py
                     # 过滤掉 __MACOSX 和隐藏文件/目录
-                    extracted_items = [p for p in extract_path.iterdir() if not p.name.startswith(("_", "."))]
+                    # 出现第二个条目时即可停止扫描
+                    extracted_items: list[os.DirEntry[str]] = []
+                    with os.scandir(extract_path) as it:
+                        for extracted in it:
+                            if not extracted.name.startswith(("_", ".")):
+                                extracted_items.append(extracted)
+                                if len(extracted_items) > 1:
+                                    break
 
                     if len(extracted_items) == 1 and extracted_items[0].is_dir():
-                        nested_plugin = extracted_items[0] / "plugin.py"
+                        nested_plugin = Path(extracted_items[0].path, "plugin.py")
                         if nested_plugin.exists():
                             entry_point = nested_plugin
 
@@ -153,8 +221,7 @@ def load_lib_from_zip(zip_path: Path, lib_name: str | None = None, extract_dirna
     try:
         with zipfile.ZipFile(zip_path, "r") as zf:
             extract_path = PLUGIN_CACHE_DIR / "lib_cache" / (extract_dirname or zip_path.stem)
-            extract_path.mkdir(parents=True, exist_ok=True)
-            zf.extractall(extract_path)
+            _extract_zip(zf, extract_path)
 
             if lib_name:
                 lib_path = extract_path / lib_name
@@ -186,22 +253,33 @@ def _load_plugin_libs(plugin_dir: Path, module_name: str) -> list[str] | None:
     返回加载的路径列表，如果加载失败返回 None。
     """
     loaded_paths = []
+    # 单次扫描目录，同时找出 lib.zip 与 lib[xxx].zip
+    has_lib_zip = False
+    named_libs: list[tuple[Path, str]] = []
+    with os.scandir(plugin_dir) as it:
+        for entry in it:
+            name = entry.name
+            if name == "lib.zip":
+                has_lib_zip = entry.is_file()
+            elif (
+                name.startswith(LIB_ZIP_PREFIX)
+                and name.endswith(LIB_ZIP_SUFFIX)
+                and len(name) > len(LIB_ZIP_PREFIX) + len(LIB_ZIP_SUFFIX)
+                and entry.is_file()
+            ):
+                named_libs.append((Path(entry.path), name[len(LIB_ZIP_PREFIX) : -len(LIB_ZIP_SUFFIX)]))
+
     # 1. Check lib.zip
-    lib_zip = plugin_dir / "lib.zip"
-    if lib_zip.exists() and lib_zip.is_file():
-        path = load_lib_from_zip(lib_zip, extract_dirname=module_name)
+    if has_lib_zip:
+        path = load_lib_from_zip(plugin_dir / "lib.zip", extract_dirname=module_name)
         if path is None:
             return None
         loaded_paths.append(path)
 
     # 2. Check lib[xxx].zip
-    for item in plugin_dir.iterdir():
-        if item.is_file() and item.suffix == ".zip":
-            match = re.match(r"^lib\[(.+)\]\.zip$", item.name)
-            if match:
-                lib_name = match.group(1)
-                path = load_lib_from_zip(item, extract_dirname=lib_name)
-                if path is None:
-                    return None
-                loaded_paths.append(path)
+    for lib_zip, lib_name in named_libs:
+        path = load_lib_from_zip(lib_zip, extract_dirname=lib_name)
+        if path is None:
+            return None
+        loaded_paths.append(path)
     return loaded_paths
@@ -16,6 +16,8 @@ from __future__ import annotations
 
 from contextlib import asynccontextmanager
 from enum import IntFlag
+from functools import lru_cache
+from operator import attrgetter
 from typing import TYPE_CHECKING, Literal, cast
 
 import aiotieba.typing as aiotieba
@@ -33,10 +35,11 @@ from src.schemas.tieba import Content, Model2Content, User
 from src.utils.logging import system_logger
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncGenerator, Iterable
+    from collections.abc import AsyncGenerator, Callable, Iterable
     from datetime import datetime
 
     from sqlalchemy.engine import CursorResult
+    from sqlalchemy.sql.dml import Insert
 
     from src.core.config import SystemConfig
     from src.schemas.event import UpdateEventData
@@ -67,6 +70,45 @@ class UpdateStatus(IntFlag):
     HAS_CHANGES = UPDATED | NEW_WITH_CHILD
 
 
+@lru_cache(maxsize=16)
+def _row_builder(model: type[Base]) -> tuple[tuple[str, ...], Callable[[Base], tuple]]:
+    """
+    按模型缓存列名与取值函数，attrgetter 一次调用即可取出整行的列值
+
+    Returns:
+        tuple: (列名, 返回列值元组的函数)
+    """
+    names = tuple(c.name for c in model.__table__.columns)
+    getter = attrgetter(*names)
+    if len(names) == 1:
+        # 单个列名时 attrgetter 返回值本身而非元组
+        return names, lambda inst: (getter(inst),)
+    return names, getter
+
+
+@lru_cache(maxsize=64)
+def _insert_statement(
+    dialect: str, model: type[Base], on_conflict: Literal["ignore", "upsert"], update_cols: frozenset[str]
+) -> Insert:
+    """
+    按方言、模型与冲突策略缓存 INSERT 语句
+
+    语句不绑定 VALUES，参数列表在执行时以 executemany 方式传入，
+    不同批次大小共用同一编译结果
+    """
+    table = model.__table__
+    stmt = pg_insert(table) if dialect == "postgresql" else sqlite_insert(table)
+    pk_index_elems = [c for c in table.columns if c.primary_key]
+
+    if on_conflict == "ignore":
+        return stmt.on_conflict_do_nothing(index_elements=pk_index_elems)
+    # upsert
+    return stmt.on_conflict_do_update(
+        index_elements=pk_index_elems,
+        set_={name: stmt.excluded[name] for name in update_cols},
+    )
+
+
 class Database:
     engine: AsyncEngine
     sessionmaker: async_sessionmaker[AsyncSession]
@@ -180,56 +222,33 @@ class Database:
         if not all(isinstance(i, model) for i in item_list):
             raise TypeError
 
-        table = model.__table__
-        columns = list(table.columns)
-        pk_cols = [c for c in columns if c.primary_key]
-        non_pk_cols = [c for c in columns if not c.primary_key]
-
-        update_cols: set[str] = set()
+        update_cols: frozenset[str] = frozenset()
         if on_conflict == "upsert":
+            non_pk_names = (c.name for c in model.__table__.columns if not c.primary_key)
             if exclude_columns is None:
-                update_cols = {c.name for c in non_pk_cols}
+                update_cols = frozenset(non_pk_names)
             else:
                 exclude_set = set(exclude_columns)
-                update_cols = {c.name for c in non_pk_cols if c.name not in exclude_set}
+                update_cols = frozenset(name for name in non_pk_names if name not in exclude_set)
                 if not update_cols:
                     on_conflict = "ignore"
 
-        rows: list[dict] = []
-        for inst in item_list:
-            row: dict = {}
-            for c in columns:
-                v = getattr(inst, c.name)
-                if v is not None:
-                    row[c.name] = v
-            rows.append(row)
-
-        dialect = cls.engine.dialect.name
-        pk_names = [c.name for c in pk_cols]
-        pk_index_elems = [table.c[name] for name in pk_names]
-
-        # 分批处理
-        batches: list[list[dict]]
-        if chunk_size and chunk_size > 0 and len(rows) > chunk_size:
-            batches = [rows[i : i + chunk_size] for i in range(0, len(rows), chunk_size)]
-        else:
-            batches = [rows]
+        # executemany 要求同一次执行的参数键相同，按非空列分组
+        names, getter = _row_builder(model)
+        groups: dict[tuple[str, ...], list[dict]] = {}
+        for values in map(getter, item_list):
+            row = {name: v for name, v in zip(names, values, strict=True) if v is not None}
+            groups.setdefault(tuple(row), []).append(row)
 
-        stmt = pg_insert(model) if dialect == "postgresql" else sqlite_insert(model)
-
-        if on_conflict == "ignore":
-            stmt = stmt.on_conflict_do_nothing(index_elements=pk_index_elems)
-        else:  # upsert
-            stmt = stmt.on_conflict_do_update(
-                index_elements=pk_index_elems,
-                set_={name: stmt.excluded[name] for name in update_cols},
-            )
+        stmt = _insert_statement(cls.engine.dialect.name, model, on_conflict, update_cols)
 
         async with cls.get_session() as session:
-            if stmt is not None:
-                for batch in batches:
-                    await session.execute(stmt.values(batch))
-                await session.commit()
+            for rows in groups.values():
+                # 分批处理
+                step = chunk_size if chunk_size and chunk_size > 0 else len(rows)
+                for i in range(0, len(rows), step):
+                    await session.execute(stmt, rows[i : i + step])
+            await session.commit()
 
     @classmethod
     async def get_contents_by_pids(cls, pids: Iterable[int]) -> list[ContentModel]:
@@ -11,6 +11,8 @@ from src.schemas.tieba import AccountInfo, QrcodeData, QrcodeStatus, QrcodeStatu
 from src.utils.anonymous import AnonymousAiohttp
 from src.utils.logging import LOG_DIR, exception_logger, system_logger
 
+SINGLE_QUOTED_PATTERN = re.compile(r"'([^']+)'")
+
 
 class GetQrcodeResponse(TypedDict):
     imgurl: str
@@ -145,7 +147,7 @@ class TiebaQrcodeLogin:
 
                 text = await resp.text()
                 try:
-                    correct_text = re.sub(r"'([^']+)'", r'"\1"', text.replace("\\&", "&"))  # 将单引号改为双引号
+                    correct_text = SINGLE_QUOTED_PATTERN.sub(r'"\1"', text.replace("\\&", "&"))  # 将单引号改为双引号
                     data: QrBdussLoginResponse = json.loads(correct_text)
                 except json.JSONDecodeError:
                     file = LOG_DIR / "tieba.qrbdusslogin.txt"
@@ -129,8 +129,7 @@ class UserManager:
         if user.config.enable == status:
             return True
 
-        new_config = user.config.model_copy(deep=True)
-        new_config.enable = status
+        new_config = user.config.model_copy(update={"enable": status})
         await cls.update_config(new_config, system_access=by_system)
 
         op_text = "启用" if status else "禁用"
@@ -145,10 +145,18 @@ class TiebaClient:
 
 
 class ConfirmCache(ExpireCache[ConfirmData]):
-    # 兼容旧数据
-    # TODO v1.0.0+ 移除
     @staticmethod
-    def deserialize_data(data: ConfirmData) -> ConfirmData:
+    def serialize_data(data: ConfirmData) -> str:
+        # 以 JSON 储存，避免 pickle 序列化整个模型对象
+        return data.model_dump_json()
+
+    @staticmethod
+    def deserialize_data(data: ConfirmData | str | bytes) -> ConfirmData:
+        if isinstance(data, (str, bytes)):
+            return ConfirmData.model_validate_json(data)
+
+        # 兼容旧数据（pickle 储存的模型对象）
+        # TODO v1.0.0+ 移除
         if hasattr(data, "rule_name"):
             return data
 
@@ -169,6 +177,7 @@ class User:
             self.dir.mkdir(parents=True)
 
         self.processer = Processer(config)
+        self._mandatory_confirm: bool = config.process.mandatory_confirm
         self.confirm = ConfirmCache(self.dir / "confirm", expire_time=self.config.process.confirm_expire)
         self.logger = logger.bind(name=f"user.{self.config.user.username}")
         self.client: TiebaClient = TiebaClient(self.logger)
@@ -202,8 +211,9 @@ class User:
     async def stop(self, _: None = None):
         # 执行此操作后，该user不应再被使用
         if self.valid:
-            [i.un_register() for i in self.listeners]
-            self.listeners.clear()
+            listeners, self.listeners = self.listeners, []
+            for listener in listeners:
+                listener.un_register()
 
             await self.client.stop()
 
@@ -234,6 +244,7 @@ class User:
         self.config = new_config
 
         self.processer = Processer(new_config)
+        self._mandatory_confirm = new_config.process.mandatory_confirm
         if new_config.forum.login_ready:
             if (
                 new_config.forum.bduss != old_config.forum.bduss
@@ -306,8 +317,9 @@ class User:
         """
         执行规则的直接操作
         """
-        if self.config.process.mandatory_confirm or rule.manual_confirm or (options and options.need_confirm):
-            if options and options.need_confirm:
+        force_confirm = options is not None and options.need_confirm
+        if self._mandatory_confirm or rule.manual_confirm or force_confirm:
+            if force_confirm:
                 # 当通过参数强制确认时，不执行（即使设置了direct=True）
                 og = rule.operations
 
@@ -1,3 +1,4 @@
+from collections.abc import AsyncIterator
 from pathlib import Path
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
@@ -125,19 +126,25 @@ class ExpireCache[T]:
         # Logic 1 end
 
         # logic 2: 变更所有已缓存项目的expire
+        # 需删除的键统一收集后批量删除，避免逐个删除带来的多次往返
+        expired_keys = set()
         async for key in self.cache.scan("*"):
             expire = await self.cache.get_expire(key)
             if expire == UNLIMITED:
                 continue
             if expire == NOT_EXIST:
-                await self.cache.delete(key)
+                expired_keys.add(key)
                 continue
 
+            # expire 为剩余存活时间（秒）
             new_expire = expire + expire_delta
             if new_expire <= 0:
-                await self.cache.delete(key)
+                expired_keys.add(key)
             else:
                 await self.cache.expire(key, timeout=new_expire)
+
+        if expired_keys:
+            await self.cache.delete_many(*expired_keys)
         # Logic 2 end
 
         self.expire_time = new_expire_time
@@ -156,18 +163,30 @@ class ExpireCache[T]:
     def deserialize_data(data) -> T:
         return data
 
+    async def iter_items(self) -> AsyncIterator[tuple[Key, T]]:
+        """
+        逐个产出缓存的 (key, 反序列化值)，不一次性加载全部缓存
+        """
+        async for key, data in self.cache.get_match("*"):
+            if data is not None:
+                yield key, self.deserialize_data(data)
+
+    async def iter_values(self) -> AsyncIterator[T]:
+        """
+        逐个产出缓存的反序列化值，不一次性加载全部缓存
+        """
+        async for _, data in self.cache.get_match("*"):
+            if data is not None:
+                yield self.deserialize_data(data)
+
     async def items(self) -> list[tuple[Key, T]]:
         """
         返回所有缓存的 (key, 反序列化值) 列表
         """
-        result = [
-            (key, self.deserialize_data(data)) async for key, data in self.cache.get_match("*") if data is not None
-        ]
-        return result
+        return [item async for item in self.iter_items()]
 
     async def values(self) -> list[T]:
         """
         返回所有缓存的反序列化值列表
         """
-        result = [self.deserialize_data(data) async for _, data in self.cache.get_match("*") if data is not None]
-        return result
+        return [value async for value in self.iter_values()]
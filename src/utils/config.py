@@ -1,3 +1,4 @@
+import tomllib
 from pathlib import Path
 
 import tomlkit
@@ -6,8 +7,12 @@ import yaml
 
 def read_config[T](path: Path, obj: type[T]) -> T:
     if path.exists():
+        if path.suffix == ".toml":
+            # 读取时无需保留格式与注释，使用标准库的 tomllib 解析，写入仍使用 tomlkit
+            with path.open("rb") as f:
+                return obj.model_validate(tomllib.load(f))  # type: ignore
         with path.open(encoding="utf8") as f:
-            return obj.model_validate((tomlkit.load(f) if path.suffix == ".toml" else yaml.safe_load(f)) or {})  # type: ignore
+            return obj.model_validate(yaml.safe_load(f) or {})  # type: ignore
     else:
         return obj.model_validate({})  # type: ignore
 
@@ -18,10 +18,8 @@ class AsyncEvent[T]:
     def __init__(self) -> None:
         self._listeners: list[Callable[[T], Awaitable[None]]] = []
 
-    def on(self, fn: Callable[[T], Awaitable[None]] | Callable[[T], None] | EventListener):
-        if isinstance(fn, EventListener):
-            fn = fn.fn
-
+    @staticmethod
+    def _wrap(fn: Callable[[T], Awaitable[None]] | Callable[[T], None]) -> Callable[[T], Awaitable[None]]:
         error_msg = "事件处理函数执行异常"
 
         from .logging import exception_logger
@@ -38,6 +36,13 @@ class AsyncEvent[T]:
                 with exception_logger(error_msg):
                     fn(data)
 
+        return async_fn
+
+    def on(self, fn: Callable[[T], Awaitable[None]] | Callable[[T], None] | EventListener):
+        if isinstance(fn, EventListener):
+            fn = fn.fn
+
+        async_fn = self._wrap(fn)
         self._listeners.append(async_fn)
 
         def un_register():
@@ -47,3 +52,38 @@ class AsyncEvent[T]:
 
     async def broadcast(self, data: T):
         await asyncio.gather(*(i(data) for i in self._listeners))
+
+
+class KeyedAsyncEvent[K, T](AsyncEvent[T]):
+    """
+    按 key 分发的事件
+
+    on 注册的监听器接收全部事件，on_key 注册的监听器仅接收 key 相同的事件，广播时无需逐个监听器过滤
+
+    Attributes:
+        key (Callable[[T], K]): 从事件数据中取得 key 的函数
+    """
+
+    def __init__(self, key: Callable[[T], K]) -> None:
+        super().__init__()
+        self.key = key
+        self._keyed_listeners: dict[K, list[Callable[[T], Awaitable[None]]]] = {}
+
+    def on_key(self, key: K, fn: Callable[[T], Awaitable[None]] | Callable[[T], None] | EventListener):
+        if isinstance(fn, EventListener):
+            fn = fn.fn
+
+        async_fn = self._wrap(fn)
+        self._keyed_listeners.setdefault(key, []).append(async_fn)
+
+        def un_register():
+            listeners = self._keyed_listeners[key]
+            listeners.remove(async_fn)
+            if not listeners:
+                del self._keyed_listeners[key]
+
+        return EventListener(fn, un_register)
+
+    async def broadcast(self, data: T):
+        keyed_listeners = self._keyed_listeners.get(self.key(data), ())
+        await asyncio.gather(*(i(data) for i in self._listeners), *(i(data) for i in keyed_listeners))
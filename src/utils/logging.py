@@ -5,6 +5,7 @@ import logging
 import os
 import sys
 from contextlib import contextmanager
+from operator import attrgetter
 from typing import TYPE_CHECKING, Literal, NamedTuple
 
 import aiotieba
@@ -15,7 +16,7 @@ from uvicorn.config import LOGGING_CONFIG
 
 from src.core.constants import BASE_DIR, DEBUG, DEV
 
-from .event import AsyncEvent
+from .event import KeyedAsyncEvent
 
 if TYPE_CHECKING:
     from loguru import Message, Record
@@ -128,7 +129,8 @@ class LogEventData(NamedTuple):
     message: Message
 
 
-LogEvent = AsyncEvent[LogEventData]()
+# 按日志名称分发，订阅单个用户日志的监听器只会收到该用户的日志
+LogEvent = KeyedAsyncEvent[str | None, LogEventData](key=attrgetter("name"))
 
 
 LOG_LEVEL = "DEBUG" if DEBUG else os.getenv("WTM_LOG_LEVEL", "INFO").upper()
@@ -4,6 +4,9 @@ import secrets
 import socket
 import string
 import time
+import uuid
+from collections.abc import Awaitable, Callable
+from pathlib import Path
 
 
 def timestring():
@@ -82,6 +85,43 @@ class Timer:
         return time.monotonic() - self.start_time
 
 
+async def single_flight[K, T](inflight: dict[K, asyncio.Future[T]], key: K, func: Callable[[], Awaitable[T]]) -> T:
+    """
+    合并同一 key 的并发调用，仅首个调用者执行 func，其余调用者等待并共享其结果或异常
+
+    Args:
+        inflight (dict[K, asyncio.Future[T]]): 进行中的调用，由调用方持有以区分不同的用途
+        key (K): 合并的依据
+        func (Callable[[], Awaitable[T]]): 实际执行的调用
+    """
+    if (future := inflight.get(key)) is not None:
+        try:
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            # 首个调用者被取消时，由仍在等待的调用者重新执行
+            if future.cancelled() and not asyncio.current_task().cancelling():  # type: ignore
+                return await single_flight(inflight, key, func)
+            raise
+
+    future = inflight[key] = asyncio.get_running_loop().create_future()
+    # 没有其他等待者时，避免未获取的异常被事件循环报告
+    future.add_done_callback(lambda f: f.cancelled() or f.exception())
+    try:
+        result = await func()
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        if inflight.get(key) is future:
+            del inflight[key]
+
+
 def random_secret(length=32):
     return secrets.token_hex(length)
 
@@ -136,15 +176,32 @@ class Mosaic:
         return target in text
 
 
+LISTENABLE_ADDRESSES_TTL = 60
+_listenable_addresses_cache: dict[tuple[bool, bool], tuple[float, list[str]]] = {}
+
+
 def get_listenable_addresses(with_default: bool = True, ipv6: bool = False) -> list[str]:
     """
     获取所有本机可监听的 IPv4 和 IPv6 地址（不含端口）。
     包含 127.0.0.1、::1 及所有网卡地址。
 
+    结果缓存 LISTENABLE_ADDRESSES_TTL 秒，避免重复解析主机名与枚举网卡
+
     Args:
         with_default (bool): 是否包含默认的回环地址
         ipv6 (bool): 是否包含 IPv6 地址
     """
+    key = (with_default, ipv6)
+    now = time.monotonic()
+    if (cached := _listenable_addresses_cache.get(key)) and cached[0] > now:
+        return cached[1].copy()
+
+    addresses = _get_listenable_addresses(with_default, ipv6)
+    _listenable_addresses_cache[key] = (now + LISTENABLE_ADDRESSES_TTL, addresses)
+    return addresses.copy()
+
+
+def _get_listenable_addresses(with_default: bool, ipv6: bool) -> list[str]:
     addresses = set()
     # 获取主机名
     hostname = socket.gethostname()
@@ -173,6 +230,9 @@ def get_listenable_addresses(with_default: bool = True, ipv6: bool = False) -> l
     return sorted(addresses)
 
 
+PASSWORD_PATTERN = re.compile(r"^[a-zA-Z0-9\x21-\x2F\x3A-\x40\x5B-\x60\x7B-\x7E]+$")
+
+
 def validate_password(password: str, max_length: int = 32) -> bool:
     r"""
     根据如下规则验证密码有效性
@@ -185,8 +245,7 @@ def validate_password(password: str, max_length: int = 32) -> bool:
     Returns:
         如果密码符合这些要求，返回 True，否则返回 False。
     """
-    pattern = r"^[a-zA-Z0-9\x21-\x2F\x3A-\x40\x5B-\x60\x7B-\x7E]+$"
-    return len(password) <= max_length and bool(re.match(pattern, password))
+    return len(password) <= max_length and bool(PASSWORD_PATTERN.match(password))
 
 
 RANDOM_CHARS = "".join(sorted(set(string.ascii_letters + string.digits) - {"O", "I", "l", "0"}))
@@ -202,3 +261,21 @@ def random_str(length: int = 8) -> str:
     :return: 随机字符串
     """
     return "".join(secrets.choice(RANDOM_CHARS) for _ in range(length))
+
+
+async def write_bytes(path: Path, data: bytes | memoryview):
+    """
+    先写入临时文件再原子替换，读取方不会看到写了一半的文件，写入中断时删除临时文件
+    """
+
+    def _write():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            tmp_path.write_bytes(data)
+            tmp_path.replace(path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+    await asyncio.to_thread(_write)
@@ -79,6 +79,40 @@ async def test_set_expire_time_delete_when_zero():
         await c.stop()
 
 
+@pytest.mark.asyncio
+async def test_set_expire_time_disk_shrink_and_delete(tmp_path):
+    c = cache.ExpireCache(directory=tmp_path / "disk", expire_time=100)
+    try:
+        await c.set("a", "va")
+        await c.set("b", "vb")
+        # 缩短 50 秒，剩余约 50 秒，条目应保留
+        await c.set_expire_time(50)
+        assert await c.get("a") == "va"
+        assert 0 < await c.cache.get_expire("a") <= 50
+        # 再缩短到 0，所有条目应被批量删除
+        await c.set_expire_time(0)
+        assert await c.get("a") is None
+        assert await c.get("b") is None
+    finally:
+        await c.stop()
+
+
+@pytest.mark.asyncio
+async def test_iter_items_and_values():
+    c = cache.ExpireCache(directory=None, expire_time=10)
+    try:
+        await c.set("k1", "v1")
+        await c.set("k2", "v2")
+        items = {key: value async for key, value in c.iter_items()}
+        assert items == {"k1": "v1", "k2": "v2"}
+        assert sorted([value async for value in c.iter_values()]) == ["v1", "v2"]
+        # 兼容接口与迭代器结果一致
+        assert dict(await c.items()) == items
+        assert sorted(await c.values()) == ["v1", "v2"]
+    finally:
+        await c.stop()
+
+
 @pytest.mark.asyncio
 async def test_unlimited_expire_unchanged():
     # expire_time=None -> 新增键为无限期
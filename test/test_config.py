@@ -0,0 +1,52 @@
+import pytest
+from pydantic import ValidationError
+
+from src.core.config import DatabaseConfig, RuleLogic, ServerConfig, SystemConfig
+
+
+def test_server_apply_new_keeps_mosaic_fields():
+    old = ServerConfig(key="abc123456")
+    new = old.apply_new(old.mosaic)
+
+    # 前端回传的打码值应还原为原值
+    assert new.key == old.key
+    assert new.secret_key == old.secret_key
+    assert new.encryption_salt == old.encryption_salt
+    assert new.key_last_update == old.key_last_update
+    assert new == old
+
+
+def test_server_apply_new_updates_changed_fields():
+    old = ServerConfig(key="abc123456", key_last_update=0)
+    new = old.apply_new(old.model_copy(update={"key": "def123456", "key_last_update": 1}))
+
+    assert new.key == "def123456"
+    assert new.key_last_update > 0
+
+    new = old.apply_new(old.mosaic.model_copy(update={"token_expire_days": old.token_expire_days + 1}))
+    assert new.key == old.key
+    assert new.key_last_update == old.key_last_update
+    assert new.secret_key != old.secret_key
+
+
+def test_system_apply_new_round_trip():
+    old = SystemConfig(database=DatabaseConfig(type="sqlite", path="data.db", password="secret"))
+    new = old.apply_new(old.mosaic)
+
+    assert new == old
+    assert new.database.password == "secret"
+
+    changed = old.mosaic.model_copy(update={"database": old.database.model_copy(update={"password": "changed"})})
+    assert old.apply_new(changed).database.password == "changed"
+
+
+def test_rule_logic_validate_and_evaluate():
+    logic = RuleLogic(expression="(0 and 1) or (0 and not 2)")
+
+    assert logic.priority_groups == [[0], [1, 2]]
+    assert logic.evaluate_expression({0: True, 1: False, 2: False})
+    assert not logic.evaluate_expression({0: True, 1: False, 2: True})
+
+    for expression in ("0 + 1", "a and 1", "'0' or 1", "__import__('os')"):
+        with pytest.raises(ValidationError):
+            RuleLogic(expression=expression)
@@ -1,6 +1,8 @@
+from operator import itemgetter
+
 import pytest
 
-from src.utils.event import AsyncEvent, EventListener
+from src.utils.event import AsyncEvent, EventListener, KeyedAsyncEvent
 from src.utils.logging import LogRecorder
 
 
@@ -126,3 +128,23 @@ async def test_async_event_broadcast_without_listeners_noop():
     event: AsyncEvent[None] = AsyncEvent()
     # 不应抛错
     await event.broadcast(None)
+
+
+@pytest.mark.asyncio
+async def test_keyed_async_event_dispatch_by_key():
+    LogRecorder.messages["system"] = []
+    event: KeyedAsyncEvent[str, tuple[str, int]] = KeyedAsyncEvent(key=itemgetter(0))
+
+    calls: list[str] = []
+
+    event.on(lambda data: calls.append(f"all{data[1]}"))
+    el = event.on_key("a", lambda data: calls.append(f"a{data[1]}"))
+    event.on_key("b", lambda data: calls.append(f"b{data[1]}"))
+
+    await event.broadcast(("a", 1))
+    await event.broadcast(("c", 2))
+    el.un_register()
+    await event.broadcast(("a", 3))
+
+    assert sorted(calls) == ["a1", "all1", "all2", "all3"]
+    assert "a" not in event._keyed_listeners
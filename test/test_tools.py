@@ -0,0 +1,52 @@
+import asyncio
+
+import pytest
+
+from src.utils.tools import single_flight, write_bytes
+
+
+@pytest.mark.asyncio
+async def test_single_flight_coalesces_concurrent_calls():
+    inflight: dict[str, asyncio.Future[int]] = {}
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return calls
+
+    results = await asyncio.gather(*(single_flight(inflight, "key", fetch) for _ in range(5)))
+
+    assert results == [1] * 5
+    assert calls == 1
+    assert not inflight
+
+    # 上一次调用结束后重新执行
+    assert await single_flight(inflight, "key", fetch) == 2
+
+
+@pytest.mark.asyncio
+async def test_single_flight_shares_exception():
+    inflight: dict[str, asyncio.Future[int]] = {}
+
+    async def fetch():
+        await asyncio.sleep(0.01)
+        raise ValueError("fetch error")
+
+    results = await asyncio.gather(*(single_flight(inflight, "key", fetch) for _ in range(3)), return_exceptions=True)
+
+    assert all(isinstance(r, ValueError) for r in results)
+    assert not inflight
+
+
+@pytest.mark.asyncio
+async def test_write_bytes_replaces_atomically(tmp_path):
+    path = tmp_path / "cache" / "image.webp"
+
+    await write_bytes(path, b"first")
+    await write_bytes(path, memoryview(b"second"))
+
+    assert path.read_bytes() == b"second"
+    # 写入完成后不残留临时文件
+    assert [p.name for p in path.parent.iterdir()] == ["image.webp"]